@@ -1,11 +1,13 @@
 from flask import Flask, request, Response, render_template, jsonify
 from flask_cors import CORS
+import atexit
 import os
 import json
+import orjson
 import re
 import time
-import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import openai
 from groq import Groq
@@ -17,6 +19,11 @@ load_dotenv()
 openai.api_key = os.getenv("OPENAI_API_KEY")
 groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
 
+# Shared worker pool for streaming requests. Reusing threads avoids the OS
+# thread creation cost per request and caps concurrent streams.
+EXECUTOR = ThreadPoolExecutor(max_workers=64)
+atexit.register(EXECUTOR.shutdown, wait=False)
+
 app = Flask(__name__, static_folder="static", template_folder="templates")
 CORS(app)
 
@@ -34,6 +41,19 @@ def extract_translation(text):
     return ""
 
 
+def _queue_payload(response_queue, payload):
+    """
+    Put a payload on the bounded response queue with backpressure.
+    Returns False when the consumer is gone or too slow, so the producer
+    can stop pulling from the LLM stream instead of buffering forever.
+    """
+    try:
+        response_queue.put(payload, timeout=30)
+        return True
+    except queue.Full:
+        return False
+
+
 def generate_openai_stream(prompt, response_queue):
     """
     Generate a stream of responses from OpenAI's GPT-4o
@@ -45,24 +65,25 @@ def generate_openai_stream(prompt, response_queue):
         )
 
         for chunk in stream:
-            if (
-                hasattr(chunk.choices[0].delta, "content")
-                and chunk.choices[0].delta.content
-            ):
-                content = chunk.choices[0].delta.content
+            delta = chunk.choices[0].delta
+            content = getattr(delta, "content", None)
+            if content:
                 translation_buffer += content
 
                 extracted = extract_translation(translation_buffer)
                 if extracted:
-                    response_queue.put({"translation": extracted})
+                    payload = {"translation": extracted}
                 else:
-                    response_queue.put({"partialResponse": translation_buffer})
+                    payload = {"partialResponse": translation_buffer}
 
-        response_queue.put({"done": True})
+                if not _queue_payload(response_queue, payload):
+                    return
+
+        _queue_payload(response_queue, {"done": True})
     except Exception as e:
         print(f"OpenAI error: {str(e)}")
-        response_queue.put({"error": str(e)})
-        response_queue.put({"done": True})
+        _queue_payload(response_queue, {"error": str(e)})
+        _queue_payload(response_queue, {"done": True})
 
 
 def generate_groq_stream(prompt, response_queue):
@@ -78,24 +99,25 @@ def generate_groq_stream(prompt, response_queue):
         )
 
         for chunk in stream:
-            if (
-                hasattr(chunk.choices[0].delta, "content")
-                and chunk.choices[0].delta.content
-            ):
-                content = chunk.choices[0].delta.content
+            delta = chunk.choices[0].delta
+            content = getattr(delta, "content", None)
+            if content:
                 translation_buffer += content
 
                 extracted = extract_translation(translation_buffer)
                 if extracted:
-                    response_queue.put({"translation": extracted})
+                    payload = {"translation": extracted}
                 else:
-                    response_queue.put({"partialResponse": translation_buffer})
+                    payload = {"partialResponse": translation_buffer}
+
+                if not _queue_payload(response_queue, payload):
+                    return
 
-        response_queue.put({"done": True})
+        _queue_payload(response_queue, {"done": True})
     except Exception as e:
         print(f"Groq error: {str(e)}")
-        response_queue.put({"error": str(e)})
-        response_queue.put({"done": True})
+        _queue_payload(response_queue, {"error": str(e)})
+        _queue_payload(response_queue, {"done": True})
 
 
 @app.route("/")
@@ -131,33 +153,33 @@ def translate():
         else f"Translate the following Hawaiian text to English. Wrap your final translation in <translation> </translation> tags. Here is the Hawaiian text: {hawaiian_text}"
     )
 
-    # Create a response queue for thread communication
-    response_queue = queue.Queue()
+    # Bounded queue for thread communication: if the SSE client stalls or
+    # disconnects, the producer blocks and then bails out instead of
+    # buffering the whole LLM stream in memory
+    response_queue = queue.Queue(maxsize=64)
 
-    # Start the appropriate translation thread
+    # Submit the appropriate translation job to the shared worker pool
     if model_type == "best":
-        threading.Thread(
-            target=generate_openai_stream, args=(prompt, response_queue)
-        ).start()
+        EXECUTOR.submit(generate_openai_stream, prompt, response_queue)
     else:
-        threading.Thread(
-            target=generate_groq_stream, args=(prompt, response_queue)
-        ).start()
+        EXECUTOR.submit(generate_groq_stream, prompt, response_queue)
 
-    # Create a generator for SSE streaming
+    # Create a generator for SSE streaming. Frames are built as bytes with
+    # orjson so each token avoids the stdlib json encoder plus a second
+    # encode inside Flask.
     def generate():
         while True:
             try:
                 data = response_queue.get(
                     timeout=60
                 )  # Wait up to 60 seconds for new data
-                yield f"data: {json.dumps(data)}\n\n"
+                yield b"data: " + orjson.dumps(data) + b"\n\n"
 
                 if data.get("done", False) or data.get("error"):
                     break
             except queue.Empty:
                 # Timeout, end the stream
-                yield f"data: {json.dumps({'error': 'Translation timeout', 'done': True})}\n\n"
+                yield b'data: {"error": "Translation timeout", "done": true}\n\n'
                 break
 
     return Response(generate(), mimetype="text/event-stream")
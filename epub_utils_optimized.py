@@ -6,194 +6,629 @@ Uses rapidfuzz for faster fuzzy matching and n-gram indexing for efficient searc
 
 import csv
 import hashlib
+import io
 import re
+import string
 import sys
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional, Set
+from typing import List, Tuple, Dict, Optional
 import zipfile
 import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+import numpy as np
+import pandas as pd
 from collections import defaultdict
 from rapidfuzz import fuzz, process
 import multiprocessing as mp
 from functools import lru_cache
 
+# lxml (libxml2) parses XHTML several times faster than the stdlib
+# ElementTree and can recover from malformed markup, which also removes the
+# regex fallback path; it stays optional since it is not a hard dependency.
+try:
+    from lxml import etree as _lxml_etree
+    from lxml import html as _lxml_html
+
+    # Compiled once: the aligned-table cell texts, excluding the footnote
+    # and anchor markup the HTMLParser fallback also skips
+    _XPATH_ALIGNED_TABLES = _lxml_etree.XPath('//table[@class="alignedText"]')
+    _XPATH_TABLE_ROWS = _lxml_etree.XPath(".//tr")
+    _XPATH_ENGLISH_CELL_TEXT = _lxml_etree.XPath(
+        './td[starts-with(@class, "first")]'
+        "//text()[not(ancestor::a or ancestor::sup or ancestor::sub)]"
+    )
+    _XPATH_HAWAIIAN_CELL_TEXT = _lxml_etree.XPath(
+        './td[starts-with(@class, "second")]'
+        "//text()[not(ancestor::a or ancestor::sup or ancestor::sub)]"
+    )
+except ImportError:
+    _lxml_etree = None
+    _lxml_html = None
+
+# Patterns used in per-passage/per-page hot paths, compiled once at import.
+# re.sub with a literal pattern still pays a string-keyed cache lookup on
+# every call; a bound pattern method skips that entirely.
+_HTMLTAG_RE = re.compile(r"<[^>]+>")
+_BRACKET_NUM_RE = re.compile(r"\[\s*\d+\s*\]")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=\.)\s+(?=[A-Z])")
+_DOUBLE_VOWEL_RE = re.compile(r"[aeiou]{2,}")
+# Apostrophe-like marks that signal the ʻokina: straight and typographic
+# quotes plus the linguistically correct U+02BB
+_OKINA_RE = re.compile("[‘’'ʻ]")
+_WS_RE = re.compile(r"\s+")
+
+# Punctuation deletion table for text normalization: str.translate is a
+# C-level table lookup, much faster than walking every character through the
+# [^\w\s] regex. Covers ASCII punctuation plus the typographic quotes,
+# dashes and ellipses that appear in the source texts (the ʻokina is a
+# letter and is kept, matching the old regex behavior).
+_PUNCT_TABLE = str.maketrans(
+    "",
+    "",
+    string.punctuation + "‘’“”–—…«»",
+)
+
+# Vowel deletion table: counting vowels as a length difference after a
+# C-level translate beats a Python per-character loop
+_VOWEL_DEL = str.maketrans("", "", "aeiou")
+
+# Dedup fingerprints: xxhash's XXH3 is several times faster than anything in
+# hashlib for this non-cryptographic use, but it is not a project
+# dependency, so BLAKE2b stays as the baseline. Hashes are recomputed from
+# text on every run, so the two never need to agree across environments.
+# Digests are 64-bit ints rather than hex strings: membership tests hash
+# and compare one machine word instead of a 16-to-32-character string, and
+# 64 bits keeps collisions negligible at this corpus scale.
+try:
+    import xxhash as _xxhash
+except ImportError:
+    _xxhash = None
+
+if _xxhash is not None:
+
+    def _digest_normalized(normalized: str) -> int:
+        return _xxhash.xxh3_64_intdigest(normalized)
+
+else:
+
+    def _digest_normalized(normalized: str) -> int:
+        return int.from_bytes(
+            hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+
 
 class NGramIndex:
     """N-gram index for fast approximate string matching."""
 
+    # Unigram fallback postings are only materialized for corpora below
+    # this word count; larger corpora would make single-word candidate
+    # lists uselessly huge anyway
+    UNIGRAM_FALLBACK_MAX_WORDS = 500_000
+
+    # Shingle keys are rolling polynomial hashes over interned word ids:
+    # h = h * PRIME + word_id, masked to 63 bits. This skips building a
+    # joined string per shingle entirely; a (vanishingly rare) collision
+    # just merges two candidate lists, which the rapidfuzz verification
+    # stage tolerates.
+    _HASH_PRIME = 1000003
+    _HASH_MASK = (1 << 63) - 1
+
     def __init__(self, n=3):
         self.n = n
-        self.index = defaultdict(set)
+        self.index = defaultdict(list)  # Postings keyed by shingle hash
         self.word_positions = {}  # Maps word positions to original text positions
+        self._word_to_id = {}  # Vocabulary shared across all indexed texts
+        self._tokens = {}  # Lowercased tokens per text, for the unigram fallback
+        self._unigram_postings = None
+        self._arrays_ready = False
 
     def build(self, text: str, text_id: str = "main"):
         """Build n-gram index from text."""
-        words = text.lower().split()
+        # Tokenize once; the original-case words drive position tracking and
+        # their lowercased forms drive the n-gram keys
+        words = text.split()
+        words_lower = [word.lower() for word in words]
 
         # Store word positions for later retrieval
-        self.word_positions[text_id] = []
+        positions = self.word_positions[text_id] = []
         current_pos = 0
-        for word in text.split():  # Use original text to preserve case
-            self.word_positions[text_id].append((current_pos, current_pos + len(word)))
+        for word in words:
+            positions.append((current_pos, current_pos + len(word)))
             current_pos += len(word) + 1
 
-        # Index n-grams
-        for i in range(len(words)):
-            # Create n-grams of various sizes around this position
-            for size in range(1, self.n + 1):
-                if i + size <= len(words):
-                    ngram = " ".join(words[i : i + size])
-                    self.index[ngram].add((text_id, i, size))
+        # Index only max-length n-grams: the shorter shingles tripled the
+        # postings volume and mostly produced noise candidates that the
+        # overlap filter threw away. Queries generate the same length-n
+        # shingles, so coverage is unchanged for any query of >= n words.
+        num_words = len(words_lower)
+        n = self.n
+        index = self.index
+        word_to_id = self._word_to_id
+        word_ids = [word_to_id.setdefault(w, len(word_to_id)) for w in words_lower]
+        prime, mask = self._HASH_PRIME, self._HASH_MASK
+        for i in range(num_words - n + 1):
+            h = 0
+            for wid in word_ids[i : i + n]:
+                h = (h * prime + wid) & mask
+            index[h].append((text_id, i))
+
+        self._tokens[text_id] = words_lower
+
+        # Flat postings arrays need rebuilding after new text is indexed
+        self._arrays_ready = False
+        self._unigram_postings = None
+
+    def build_arrays(self):
+        """
+        Convert the dict-of-sets postings into flat NumPy arrays so query
+        scoring can run as vectorized array accumulation instead of
+        Python tuple iteration.
+        """
+        # Give each indexed text a contiguous block of a global position
+        # space so scores for all texts fit in one array
+        self._text_ids = sorted(self.word_positions)
+        self._text_base = {}
+        total = 0
+        for text_id in self._text_ids:
+            self._text_base[text_id] = total
+            total += len(self.word_positions[text_id])
+        self._num_positions = total
+        self._block_starts = np.array(
+            [self._text_base[t] for t in self._text_ids], dtype=np.int64
+        )
+
+        # CSR layout: one slot per shingle hash, postings stored as one flat
+        # position array sliced by offsets. All indexed shingles have
+        # length n, so no per-posting size array is needed.
+        self._slot_of = {}
+        offsets = [0]
+        all_pos = []
+        text_base = self._text_base
+        for ngram_hash, postings in self.index.items():
+            self._slot_of[ngram_hash] = len(offsets) - 1
+            for text_id, pos in postings:
+                all_pos.append(text_base[text_id] + pos)
+            offsets.append(len(all_pos))
+
+        self._post_offsets = np.asarray(offsets, dtype=np.int64)
+        self._post_pos = np.asarray(all_pos, dtype=np.int32)
+        self._arrays_ready = True
+
+    def _build_unigram_postings(self):
+        """
+        Materialize per-word position arrays for queries shorter than n
+        words, which generate no length-n shingles.
+        """
+        postings = defaultdict(list)
+        for text_id in self._text_ids:
+            base = self._text_base[text_id]
+            for i, word in enumerate(self._tokens[text_id]):
+                postings[word].append(base + i)
+        self._unigram_postings = {
+            word: np.asarray(pos_list, dtype=np.int32)
+            for word, pos_list in postings.items()
+        }
+
+    def _global_pos_to_text(self, global_pos: int) -> Tuple[str, int]:
+        """Map a global position back to its (text_id, position) pair."""
+        block = int(np.searchsorted(self._block_starts, global_pos, side="right")) - 1
+        text_id = self._text_ids[block]
+        return text_id, global_pos - self._text_base[text_id]
 
     def find_candidates(
         self, query: str, min_overlap=0.5
     ) -> List[Tuple[str, int, int]]:
         """Find candidate positions for a query string."""
+        if not self._arrays_ready:
+            self.build_arrays()
+
         query_words = query.lower().split()
-        query_ngrams = set()
+        num_query_words = len(query_words)
+        n = self.n
+        scores = np.zeros(self._num_positions, dtype=np.int32)
+
+        if num_query_words >= n:
+            # Length-n shingles only. Query words are mapped through the
+            # shared vocabulary first: a word the index has never seen
+            # cannot appear in any corpus shingle, so windows containing
+            # one are dropped outright.
+            word_to_id = self._word_to_id
+            query_ids = [word_to_id.get(w) for w in query_words]
+            prime, mask = self._HASH_PRIME, self._HASH_MASK
+            # pow(prime, n-1) modulo 2**63 lets the window hash roll with
+            # one subtract + multiply-add per slide instead of recomputing
+            # n multiply-adds per window (& mask is reduction mod 2**63)
+            lead_pow = pow(prime, n - 1, mask + 1)
+            # hash -> offsets of that shingle within the query. Keeping the
+            # offsets lets each posting vote for the window *start* it
+            # implies, so a true match accumulates one hit per matching
+            # shingle; scoring the shingle positions themselves would give
+            # every candidate the same constant score (at most one shingle
+            # starts at any position) and make the ranking arbitrary.
+            query_shingles = defaultdict(list)
+            run_start = 0
+            for i, wid in enumerate(query_ids + [None]):
+                if wid is not None:
+                    continue
+                # Roll across [run_start, i), a maximal stretch of known words
+                if i - run_start >= n:
+                    h = 0
+                    for rid in query_ids[run_start : run_start + n]:
+                        h = (h * prime + rid) & mask
+                    query_shingles[h].append(run_start)
+                    for j in range(run_start + 1, i - n + 1):
+                        h = (
+                            (h - query_ids[j - 1] * lead_pow) * prime
+                            + query_ids[j + n - 1]
+                        ) & mask
+                        query_shingles[h].append(j)
+                run_start = i + 1
+            slot_of = self._slot_of
+            post_offsets = self._post_offsets
+            post_pos = self._post_pos
+            # Gather the postings slices for every matched shingle, shifted
+            # back by the shingle's query offset, and score the implied
+            # window starts with one bincount pass: a tight C loop over a
+            # contiguous int32 buffer instead of np.add.at's per-slice
+            # scattered updates
+            matched = []
+            for h, offsets in query_shingles.items():
+                slot = slot_of.get(h)
+                if slot is None:
+                    continue
+                start, end = post_offsets[slot], post_offsets[slot + 1]
+                positions = post_pos[start:end]
+                for offset in offsets:
+                    matched.append(positions - offset if offset else positions)
+            if matched:
+                window_starts = np.concatenate(matched)
+                window_starts = window_starts[window_starts >= 0]
+                counts = np.bincount(window_starts, minlength=self._num_positions)
+                # A chain of k aligned shingles covers k + n - 1 words, so
+                # nonzero hit counts shift by n - 1 to be comparable with
+                # the word-based min_score below
+                scores = np.where(counts > 0, counts + n - 1, 0).astype(np.int32)
+            min_score = num_query_words * min_overlap
+        else:
+            # Queries too short to form a length-n shingle fall back to
+            # per-word postings, built lazily and only for small corpora
+            if self._unigram_postings is None:
+                if self._num_positions > self.UNIGRAM_FALLBACK_MAX_WORDS:
+                    return []
+                self._build_unigram_postings()
+            for word in set(query_words):
+                positions = self._unigram_postings.get(word)
+                if positions is not None:
+                    scores[positions] += 1
+            min_score = num_query_words * min_overlap
+        # Vectorized filter, top-K cut and ordering: one mask pass over the
+        # contiguous scores buffer, argpartition to keep the best 100
+        # without fully sorting, then a stable descending sort of just the
+        # survivors
+        keep_idx = np.flatnonzero(scores >= max(min_score, 1))
+        if keep_idx.size == 0:
+            return []
+        if keep_idx.size > 100:
+            top = np.argpartition(scores[keep_idx], -100)[-100:]
+            keep_idx = keep_idx[top]
+        keep_idx = keep_idx[np.argsort(-scores[keep_idx], kind="stable")]
+
+        # Map global positions back to (text_id, position) in one pass
+        blocks = np.searchsorted(self._block_starts, keep_idx, side="right") - 1
+        return [
+            (
+                self._text_ids[block],
+                int(global_pos - self._block_starts[block]),
+                int(scores[global_pos]),
+            )
+            for block, global_pos in zip(blocks, keep_idx)
+        ]
 
-        # Generate all n-grams from query
-        for i in range(len(query_words)):
-            for size in range(1, min(self.n + 1, len(query_words) - i + 1)):
-                ngram = " ".join(query_words[i : i + size])
-                query_ngrams.add(ngram)
 
-        # Find positions containing query n-grams
-        position_scores = defaultdict(float)
-        for ngram in query_ngrams:
-            if ngram in self.index:
-                for text_id, pos, size in self.index[ngram]:
-                    # Score based on n-gram size (larger n-grams are more specific)
-                    position_scores[(text_id, pos)] += size
+# Skip markers for aligned-table rows that are navigation or boilerplate
+# rather than passage text
+_PAIR_SKIP_MARKERS = ("contents", "volume", "page", "ebookmaker", "chapter", "mokuna")
 
-        # Filter candidates by minimum overlap
-        min_score = len(query_words) * min_overlap
-        candidates = []
-        for (text_id, pos), score in position_scores.items():
-            if score >= min_score:
-                candidates.append((text_id, pos, int(score)))
 
-        # Sort by score (descending)
-        candidates.sort(key=lambda x: x[2], reverse=True)
-        return candidates[:100]  # Return top 100 candidates
+def _clean_pair(english_text: str, hawaiian_text: str) -> Optional[Tuple[str, str]]:
+    """
+    Apply the shared length, boilerplate and cleanup rules to one aligned
+    row. Returns (hawaiian, english) or None if the row is rejected.
+    """
+    if len(english_text) > 50 and len(hawaiian_text) > 50:
+        head = english_text.lower()[:100]
+        if not any(skip in head for skip in _PAIR_SKIP_MARKERS):
+            english_text = _BRACKET_NUM_RE.sub("", _WS_RE.sub(" ", english_text))
+            hawaiian_text = _BRACKET_NUM_RE.sub("", _WS_RE.sub(" ", hawaiian_text))
+            return (hawaiian_text, english_text)
+    return None
 
 
-def extract_text_from_epub_html_aware(epub_path: str) -> List[Tuple[str, str]]:
+class BilingualTableExtractor(HTMLParser):
     """
-    Extract aligned Hawaiian-English pairs using HTML table structure.
-    Returns list of (hawaiian, english) tuples.
+    Pure-Python fallback parser for aligned bilingual tables.
+
+    Mirrors the lxml XPath walk: every <tr> inside the aligned table —
+    including rows of tables nested in its cells, such as the embedded
+    genealogy charts and alignedVerse blocks — is a candidate pair built
+    from all descendant text of its "first"/"second" cells, minus the
+    anchor and footnote markup both paths skip.
     """
-    from html.parser import HTMLParser
-
-    class BilingualTableExtractor(HTMLParser):
-        def __init__(self):
-            super().__init__()
-            self.in_table = False
-            self.in_english_cell = False
-            self.in_hawaiian_cell = False
-            self.current_english = []
-            self.current_hawaiian = []
-            self.pairs = []
-            self.current_text = []
-            self.skip_tags = {"a", "sup", "sub"}
+
+    def __init__(self):
+        super().__init__()
+        self.table_depth = 0
+        # One accumulator per open <tr>: nested tables keep several rows
+        # in flight at once, and each piece of text belongs to every
+        # enclosing classed cell, the way //text() collects descendants
+        self.open_rows = []
+        # (row index, "english"/"hawaiian"/None) per open <td>
+        self.open_cells = []
+        self.pairs = []
+        self.skip_tags = {"a", "sup", "sub"}
+        self.in_skip_tag = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs_dict = dict(attrs)
+
+        if tag == "table":
+            if self.table_depth or attrs_dict.get("class") == "alignedText":
+                self.table_depth += 1
+
+        elif self.table_depth and tag == "tr":
+            self.open_rows.append(([], []))
+
+        elif self.table_depth and tag == "td":
+            cell_class = attrs_dict.get("class", "")
+            if cell_class.startswith("first"):
+                role = 0
+            elif cell_class.startswith("second"):
+                role = 1
+            else:
+                role = None
+            self.open_cells.append((len(self.open_rows) - 1, role))
+
+        elif tag in self.skip_tags:
+            self.in_skip_tag = True
+
+    def handle_endtag(self, tag):
+        if tag == "table" and self.table_depth:
+            self.table_depth -= 1
+            if not self.table_depth:
+                # Flush rows a malformed document left unclosed
+                while self.open_rows:
+                    self._save_row(self.open_rows.pop())
+                self.open_cells.clear()
+
+        elif tag == "tr" and self.open_rows:
+            self._save_row(self.open_rows.pop())
+
+        elif tag == "td" and self.open_cells:
+            self.open_cells.pop()
+
+        elif tag in self.skip_tags:
             self.in_skip_tag = False
 
-        def handle_starttag(self, tag, attrs):
-            attrs_dict = dict(attrs)
-
-            if tag == "table" and attrs_dict.get("class") == "alignedText":
-                self.in_table = True
-
-            elif self.in_table and tag == "td":
-                if attrs_dict.get("class", "").startswith("first"):
-                    self.in_english_cell = True
-                    self.in_hawaiian_cell = False
-                elif attrs_dict.get("class", "").startswith("second"):
-                    self.in_hawaiian_cell = True
-                    self.in_english_cell = False
-
-            elif tag in self.skip_tags:
-                self.in_skip_tag = True
-
-        def handle_endtag(self, tag):
-            if tag == "table" and self.in_table:
-                self.in_table = False
-                self._save_current_pair()
-
-            elif tag == "td":
-                if self.in_english_cell:
-                    self.current_english.extend(self.current_text)
-                    self.in_english_cell = False
-                elif self.in_hawaiian_cell:
-                    self.current_hawaiian.extend(self.current_text)
-                    self.in_hawaiian_cell = False
-                self.current_text = []
-
-            elif tag == "tr" and self.in_table:
-                self._save_current_pair()
-
-            elif tag in self.skip_tags:
-                self.in_skip_tag = False
-
-        def handle_data(self, data):
-            if self.in_skip_tag:
-                return
-
-            if self.in_english_cell or self.in_hawaiian_cell:
-                cleaned = data.strip()
-                if cleaned:
-                    self.current_text.append(cleaned)
-
-        def _save_current_pair(self):
-            english_text = " ".join(self.current_english).strip()
-            hawaiian_text = " ".join(self.current_hawaiian).strip()
-
-            if len(english_text) > 50 and len(hawaiian_text) > 50:
-                if not any(
-                    skip in english_text.lower()[:100]
-                    for skip in [
-                        "contents",
-                        "volume",
-                        "page",
-                        "ebookmaker",
-                        "chapter",
-                        "mokuna",
-                    ]
-                ):
-                    # Clean text
-                    english_text = re.sub(r"\s+", " ", english_text)
-                    hawaiian_text = re.sub(r"\s+", " ", hawaiian_text)
-                    english_text = re.sub(r"\[\s*\d+\s*\]", "", english_text)
-                    hawaiian_text = re.sub(r"\[\s*\d+\s*\]", "", hawaiian_text)
-                    self.pairs.append((hawaiian_text, english_text))
-
-            self.current_english = []
-            self.current_hawaiian = []
+    def handle_data(self, data):
+        if self.in_skip_tag or not self.open_cells:
+            return
+
+        cleaned = data.strip()
+        if not cleaned:
+            return
+        for row_index, role in self.open_cells:
+            if role is not None and row_index < len(self.open_rows):
+                self.open_rows[row_index][role].append(cleaned)
+
+    def _save_row(self, row):
+        english_parts, hawaiian_parts = row
+        pair = _clean_pair(
+            " ".join(english_parts).strip(), " ".join(hawaiian_parts).strip()
+        )
+        if pair:
+            self.pairs.append(pair)
 
-    all_pairs = []
 
+def _extract_pairs_from_html(content) -> List[Tuple[str, str]]:
+    """
+    Extract aligned (hawaiian, english) pairs from one HTML document,
+    given as str or undecoded bytes.
+
+    Uses libxml2 via lxml when available — the parse and the skip-tag
+    filtering both run in C through compiled XPath expressions — and falls
+    back to the character-by-character html.parser otherwise. Bytes go to
+    lxml as-is: it honors the XML encoding declaration these XHTML files
+    carry, which it rejects on already-decoded str input.
+    """
+    if _lxml_html is not None:
+        return _pairs_from_lxml_root(_lxml_html.fromstring(content))
+
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    parser = BilingualTableExtractor()
+    parser.feed(content)
+    return parser.pairs
+
+
+def _pairs_from_lxml_root(root) -> List[Tuple[str, str]]:
+    """Walk an lxml document root with the compiled XPath expressions."""
+    pairs = []
+    for table in _XPATH_ALIGNED_TABLES(root):
+        for row in _XPATH_TABLE_ROWS(table):
+            english = " ".join(
+                t.strip() for t in _XPATH_ENGLISH_CELL_TEXT(row) if t.strip()
+            )
+            hawaiian = " ".join(
+                t.strip() for t in _XPATH_HAWAIIAN_CELL_TEXT(row) if t.strip()
+            )
+            pair = _clean_pair(english, hawaiian)
+            if pair:
+                pairs.append(pair)
+    return pairs
+
+
+def _extract_pairs_from_stream(fp) -> List[Tuple[str, str]]:
+    """
+    Streaming variant of _extract_pairs_from_html: parses straight from a
+    binary file object, so peak memory per file is one read buffer rather
+    than the whole decoded document.
+    """
+    if _lxml_html is not None:
+        return _pairs_from_lxml_root(_lxml_html.parse(fp).getroot())
+
+    parser = BilingualTableExtractor()
+    text = io.TextIOWrapper(fp, encoding="utf-8")
+    # Feed boundaries are pushed back to the last whitespace so a word is
+    # never split across two handle_data calls, which would rejoin its
+    # halves with a space; html.parser buffers split-up tags by itself
+    pending = ""
+    while chunk := text.read(1 << 16):
+        chunk = pending + chunk
+        cut = max(chunk.rfind(" "), chunk.rfind("\n"), chunk.rfind("\t"))
+        if cut < 0:
+            pending = chunk
+            continue
+        parser.feed(chunk[: cut + 1])
+        pending = chunk[cut + 1 :]
+    if pending:
+        parser.feed(pending)
+    parser.close()
+    return parser.pairs
+
+
+def _parse_one_html(payload: Tuple[str, bytes]) -> List[Tuple[str, str]]:
+    """Parse one (name, raw bytes) HTML payload; module-level so it pickles."""
+    name, raw = payload
+    try:
+        # Raw bytes, not a decoded str: lxml rejects str input carrying an
+        # XML encoding declaration, which every one of these files has
+        return _extract_pairs_from_html(raw)
+    except Exception as e:
+        print(f"Error processing {name}: {e}")
+        return []
+
+
+def extract_text_from_epub_html_aware(
+    epub_path: str, workers: Optional[int] = None
+) -> List[Tuple[str, str]]:
+    """
+    Extract aligned Hawaiian-English pairs using HTML table structure.
+    Returns list of (hawaiian, english) tuples.
+
+    Each HTML file parses independently, so the files fan out across a
+    process pool; zipfile is not safe to share across processes, so the
+    raw bytes are read sequentially up front. The serial path instead
+    streams each file straight out of the zip, keeping peak memory at one
+    read buffer instead of the largest decoded document.
+    """
+    if workers is None:
+        workers = mp.cpu_count()
+
+    all_pairs = []
     with zipfile.ZipFile(epub_path, "r") as epub:
-        html_files = [
+        html_files = sorted(
             f for f in epub.namelist() if f.endswith(".html") or f.endswith(".xhtml")
-        ]
+        )
 
-        for html_file in sorted(html_files):
-            try:
-                content = epub.read(html_file).decode("utf-8")
-                parser = BilingualTableExtractor()
-                parser.feed(content)
-                all_pairs.extend(parser.pairs)
-            except Exception as e:
-                print(f"Error processing {html_file}: {e}")
-                continue
+        if workers <= 1 or len(html_files) < 2 * workers:
+            # Not enough files to pay for pool startup
+            for name in html_files:
+                try:
+                    with epub.open(name) as fp:
+                        pairs = _extract_pairs_from_stream(
+                            io.BufferedReader(fp, buffer_size=1 << 16)
+                        )
+                except Exception as e:
+                    print(f"Error processing {name}: {e}")
+                    pairs = []
+                all_pairs.extend(pairs)
+            return all_pairs
+
+        payloads = [(name, epub.read(name)) for name in html_files]
+
+    # imap (ordered) keeps the spine-sorted pair order of the serial path
+    with mp.Pool(processes=workers) as pool:
+        for pairs in pool.imap(_parse_one_html, payloads, chunksize=4):
+            all_pairs.extend(pairs)
 
     return all_pairs
 
 
+def _stream_page_text(buf) -> str:
+    """
+    Incrementally parse one XHTML page and return its whitespace-normalized
+    text, clearing elements as soon as their content has been consumed so
+    memory stays bounded by tree depth rather than document size.
+
+    iterparse does not guarantee that an element's text is populated at its
+    start event (or its tail at its end event), so harvesting is deferred to
+    the moment each piece is known to be complete: an element's text when
+    its first child starts (or at its own end if childless), and a child's
+    tail when the next sibling starts (or at the parent's end).
+    """
+    if _lxml_etree is not None:
+        events = _lxml_etree.iterparse(
+            buf,
+            events=("start", "end"),
+            recover=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+    else:
+        events = ET.iterparse(buf, events=("start", "end"))
+
+    parts = []
+    # Stack entries: [element, last ended child awaiting tail, saw_child]
+    stack = []
+    for event, elem in events:
+        if event == "start":
+            if stack:
+                parent = stack[-1]
+                last_ended = parent[1]
+                if last_ended is not None:
+                    # Previous sibling's tail is complete once we start
+                    if last_ended.tail:
+                        parts.append(last_ended.tail)
+                    last_ended.clear()
+                    parent[1] = None
+                elif not parent[2]:
+                    # First child: the parent's leading text is complete
+                    if parent[0].text:
+                        parts.append(parent[0].text)
+                parent[2] = True
+            stack.append([elem, None, False])
+        else:
+            entry = stack.pop()
+            last_ended = entry[1]
+            if last_ended is not None:
+                # Final child's tail is complete at the parent's end
+                if last_ended.tail:
+                    parts.append(last_ended.tail)
+                last_ended.clear()
+            if not entry[2] and elem.text:
+                # Childless element: its text is complete at its end
+                parts.append(elem.text)
+            if stack:
+                # Defer this element's tail to the parent/next sibling
+                stack[-1][1] = elem
+            else:
+                elem.clear()
+
+    # One join plus one C-level regex pass; the old join/split()/join built
+    # an intermediate list of every word on the page just to squeeze runs
+    # of whitespace
+    return _WS_RE.sub(" ", " ".join(parts)).strip()
+
+
 def extract_text_from_epub(epub_path: str) -> List[Dict[str, str]]:
     """
     Extract text content from EPUB file, preserving page structure.
     Returns a list of pages with their content.
+
+    Pages are parsed incrementally through _stream_page_text — libxml2 via
+    lxml when installed, the stdlib ElementTree parser otherwise; with lxml
+    the recovering parser also makes the regex tag-stripping fallback for
+    malformed pages unreachable.
     """
     pages = []
 
@@ -237,40 +672,23 @@ def extract_text_from_epub(epub_path: str) -> List[Dict[str, str]]:
                     full_path = href
 
                 try:
-                    # Read the XHTML content
-                    content = epub.read(full_path).decode("utf-8")
-
-                    # Parse the XHTML
-                    # Remove namespace declarations for easier parsing
-                    content = re.sub(r'xmlns[^=]*="[^"]*"', "", content)
-
+                    # Parse the XHTML incrementally from the zip entry
+                    # stream; elements are cleared as soon as their text is
+                    # harvested, so peak memory stays at a parse buffer
+                    # rather than the whole document tree.
                     try:
-                        root = ET.fromstring(content)
+                        with epub.open(full_path) as raw:
+                            with io.BufferedReader(raw, buffer_size=1 << 16) as buf:
+                                full_text = _stream_page_text(buf)
                     except ET.ParseError:
                         # If parsing fails, try to extract text with regex
-                        text = re.sub(r"<[^>]+>", " ", content)
+                        content = epub.read(full_path).decode("utf-8")
+                        text = _HTMLTAG_RE.sub(" ", content)
                         text = " ".join(text.split())
                         if text.strip():
                             pages.append({"file": full_path, "content": text.strip()})
                         continue
 
-                    # Extract text from the page
-                    page_text = []
-
-                    def extract_text_recursive(element, texts):
-                        if element.text:
-                            texts.append(element.text.strip())
-                        for child in element:
-                            extract_text_recursive(child, texts)
-                            if child.tail:
-                                texts.append(child.tail.strip())
-
-                    extract_text_recursive(root, page_text)
-
-                    # Join and clean the text
-                    full_text = " ".join(page_text)
-                    full_text = " ".join(full_text.split())  # Normalize whitespace
-
                     if full_text.strip():
                         pages.append({"file": full_path, "content": full_text.strip()})
 
@@ -280,15 +698,27 @@ def extract_text_from_epub(epub_path: str) -> List[Dict[str, str]]:
     return pages
 
 
-def identify_passage_pairs(
+# Precompiled language-indicator patterns for identify_passage_pairs.
+# A single case-insensitive regex search stops at the first hit and avoids
+# allocating a lowercased copy of every page.
+_HAWAIIAN_INDICATOR_RE = re.compile(
+    r"mokuna|moolelo|alii|aina|keiki|wahine|kane|kaua|laua|mau|nei|paha|kela|keia",
+    re.IGNORECASE,
+)
+_ENGLISH_INDICATOR_RE = re.compile(
+    r"chapter|legend|king|queen|island|according|tradition|history|people|chief",
+    re.IGNORECASE,
+)
+
+
+def iter_passage_pairs(
     pages: List[Dict[str, str]], start_after_preface: bool = True
-) -> List[Tuple[str, str]]:
+):
     """
-    Identify English-Hawaiian passage pairs from the extracted pages.
-    For Fornander collection, this contains bilingual parallel text within pages.
+    Generator form of identify_passage_pairs: yields pairs page by page so
+    callers can stream them through filtering without materializing the
+    full pair list first.
     """
-    pairs = []
-
     # Find pages with substantial bilingual content
     for page in pages:
         content = page["content"]
@@ -298,338 +728,222 @@ def identify_passage_pairs(
             continue
 
         # Skip if it doesn't contain both English and Hawaiian indicators
-        content_lower = content.lower()
-        has_hawaiian_indicators = any(
-            word in content_lower
-            for word in [
-                "mokuna",
-                "moolelo",
-                "alii",
-                "aina",
-                "keiki",
-                "wahine",
-                "kane",
-                "kaua",
-                "laua",
-                "mau",
-                "nei",
-                "paha",
-                "kela",
-                "keia",
-            ]
-        )
-        has_english_indicators = any(
-            word in content_lower
-            for word in [
-                "chapter",
-                "legend",
-                "king",
-                "queen",
-                "island",
-                "according",
-                "tradition",
-                "history",
-                "people",
-                "chief",
-            ]
-        )
-
-        if not (has_hawaiian_indicators and has_english_indicators):
+        if not (
+            _HAWAIIAN_INDICATOR_RE.search(content)
+            and _ENGLISH_INDICATOR_RE.search(content)
+        ):
             continue
 
         # Extract parallel passages from bilingual content
-        page_pairs = extract_bilingual_pairs(content)
-        pairs.extend(page_pairs)
-
-    return pairs
+        yield from extract_bilingual_pairs(content)
 
 
-def extract_bilingual_pairs(content: str) -> List[Tuple[str, str]]:
+def identify_passage_pairs(
+    pages: List[Dict[str, str]], start_after_preface: bool = True
+) -> List[Tuple[str, str]]:
     """
-    Extract English-Hawaiian passage pairs from bilingual text.
-    The Fornander collection has English paragraphs followed by Hawaiian translations.
+    Identify English-Hawaiian passage pairs from the extracted pages.
+    For Fornander collection, this contains bilingual parallel text within pages.
     """
-    pairs = []
+    return list(iter_passage_pairs(pages, start_after_preface))
 
-    # Use a more targeted approach based on the actual structure observed
-    # Pattern: English sentence(s) followed by Hawaiian translation(s)
 
-    # Look for specific patterns where English is followed by Hawaiian
-    # Split content where we see transitions from English to Hawaiian
+# Segment labels for extract_bilingual_pairs
+_LANG_UNKNOWN, _LANG_ENGLISH, _LANG_HAWAIIAN = 0, 1, 2
 
-    # First, let's split the content into segments around sentence boundaries
-    # but keep context together
+_BILINGUAL_SKIP_MARKERS = ("contents", "chapter", "fornander collection")
 
-    # Split on periods followed by capital letters, but be more careful
-    segments = re.split(r"(?<=\.)\s+(?=[A-Z])", content)
 
-    current_english = ""
-    current_hawaiian = ""
-    state = "unknown"  # Can be "english", "hawaiian", or "unknown"
+def _emit_bilingual_pair(pairs, english_parts, english_len, hawaiian_parts, hawaiian_len):
+    """Join and append one (hawaiian, english) pair if it passes the gates."""
+    if english_len > 100 and hawaiian_len > 100:
+        english_text = " ".join(english_parts)
+        if not any(
+            skip in english_text.lower()[:100] for skip in _BILINGUAL_SKIP_MARKERS
+        ):
+            pairs.append((" ".join(hawaiian_parts), english_text))
 
-    for segment in segments:
-        segment = segment.strip()
-        if len(segment) < 20:  # Skip very short segments
-            continue
 
-        # Score this segment
-        eng_score = score_english_text(segment)
-        haw_score = score_hawaiian_text(segment)
+def extract_bilingual_pairs(content: str) -> List[Tuple[str, str]]:
+    """
+    Extract English-Hawaiian passage pairs from bilingual text.
+    The Fornander collection has English paragraphs followed by Hawaiian translations.
 
-        # Determine what language this segment is
-        if eng_score > haw_score and eng_score > 0.2:
-            segment_lang = "english"
-        elif haw_score > eng_score and haw_score > 0.2:
-            segment_lang = "hawaiian"
-        else:
-            segment_lang = "unknown"
-
-        # State machine to build pairs
-        if state == "unknown":
-            if segment_lang == "english":
-                current_english = segment
-                state = "english"
-            elif segment_lang == "hawaiian":
-                current_hawaiian = segment
-                state = "hawaiian"
-
-        elif state == "english":
-            if segment_lang == "english":
-                # Continue building English text
-                current_english += " " + segment
-            elif segment_lang == "hawaiian":
+    Segments are scored and labeled in one vectorized pass up front; the
+    remaining label-driven loop only moves segment references between run
+    lists, so no scoring or string building happens per transition. The
+    unknown-segment absorption rules are length-conditional, which is why
+    run boundaries are still resolved sequentially rather than with a pure
+    np.diff over the labels.
+    """
+    # Split on periods followed by capital letters, keeping context together
+    segments = [
+        s
+        for s in (seg.strip() for seg in _SENTENCE_SPLIT_RE.split(content))
+        if len(s) >= 20  # Skip very short segments
+    ]
+    if not segments:
+        return []
+
+    # Score every segment once, then derive labels as one vectorized select
+    eng_scores = np.fromiter(
+        (score_english_text(s) for s in segments), np.float64, count=len(segments)
+    )
+    haw_scores = np.fromiter(
+        (score_hawaiian_text(s) for s in segments), np.float64, count=len(segments)
+    )
+    labels = np.where(
+        (eng_scores > haw_scores) & (eng_scores > 0.2),
+        _LANG_ENGLISH,
+        np.where(
+            (haw_scores > eng_scores) & (haw_scores > 0.2),
+            _LANG_HAWAIIAN,
+            _LANG_UNKNOWN,
+        ),
+    )
+
+    pairs = []
+    # Current runs accumulate as lists of segments; the joined lengths
+    # (including separators) are tracked incrementally so the >100 gates
+    # never force an early join
+    english_parts: List[str] = []
+    hawaiian_parts: List[str] = []
+    english_len = hawaiian_len = 0
+    state = _LANG_UNKNOWN
+
+    for label, segment in zip(labels.tolist(), segments):
+        if state == _LANG_UNKNOWN:
+            if label == _LANG_ENGLISH:
+                english_parts = [segment]
+                english_len = len(segment)
+                state = _LANG_ENGLISH
+            elif label == _LANG_HAWAIIAN:
+                hawaiian_parts = [segment]
+                hawaiian_len = len(segment)
+                state = _LANG_HAWAIIAN
+
+        elif state == _LANG_ENGLISH:
+            if label == _LANG_ENGLISH:
+                # Continue building the English run
+                english_parts.append(segment)
+                english_len += len(segment) + 1
+            elif label == _LANG_HAWAIIAN:
                 # Found Hawaiian after English - this might be a pair
-                current_hawaiian = segment
-                state = "hawaiian"
-            else:
+                hawaiian_parts = [segment]
+                hawaiian_len = len(segment)
+                state = _LANG_HAWAIIAN
+            elif english_len > 100:
                 # Unknown segment - might be transition
-                if len(current_english) > 100:
-                    current_english += " " + segment
-
-        elif state == "hawaiian":
-            if segment_lang == "hawaiian":
-                # Continue building Hawaiian text
-                current_hawaiian += " " + segment
-            elif segment_lang == "english":
+                english_parts.append(segment)
+                english_len += len(segment) + 1
+
+        else:  # state == _LANG_HAWAIIAN
+            if label == _LANG_HAWAIIAN:
+                # Continue building the Hawaiian run
+                hawaiian_parts.append(segment)
+                hawaiian_len += len(segment) + 1
+            elif label == _LANG_ENGLISH:
                 # We have a complete pair: previous English + previous Hawaiian
-                if (
-                    len(current_english) > 100
-                    and len(current_hawaiian) > 100
-                    and not any(
-                        skip in current_english.lower()[:100]
-                        for skip in ["contents", "chapter", "fornander collection"]
-                    )
-                ):
-                    pairs.append((current_hawaiian, current_english))
+                _emit_bilingual_pair(
+                    pairs, english_parts, english_len, hawaiian_parts, hawaiian_len
+                )
 
                 # Start new English
-                current_english = segment
-                current_hawaiian = ""
-                state = "english"
+                english_parts = [segment]
+                english_len = len(segment)
+                hawaiian_parts = []
+                hawaiian_len = 0
+                state = _LANG_ENGLISH
             else:
                 # Unknown - might be continuing Hawaiian
-                current_hawaiian += " " + segment
+                hawaiian_parts.append(segment)
+                hawaiian_len += len(segment) + 1
 
     # Don't forget the last pair if we ended in Hawaiian state
-    if (
-        state == "hawaiian"
-        and len(current_english) > 100
-        and len(current_hawaiian) > 100
-        and not any(
-            skip in current_english.lower()[:100]
-            for skip in ["contents", "chapter", "fornander collection"]
+    if state == _LANG_HAWAIIAN:
+        _emit_bilingual_pair(
+            pairs, english_parts, english_len, hawaiian_parts, hawaiian_len
         )
-    ):
-        pairs.append((current_hawaiian, current_english))
 
     return pairs
 
 
+# Language-indicator word sets for the segment scorers, built once at import.
+# frozenset membership is O(1) versus a linear scan of the old list literals,
+# which were rebuilt on every call (and carried a few duplicate entries).
+_ENGLISH_WORDS = frozenset(
+    {
+        "the", "and", "of", "to", "a", "in", "was", "that", "he", "it",
+        "with", "for", "as", "his", "on", "be", "at", "by", "this", "had",
+        "from", "they", "she", "or", "an", "were", "been", "have", "their",
+        "said", "each", "which", "do", "how", "if", "will", "up", "other",
+        "about", "out", "many", "then", "them", "these", "so", "some",
+        "her", "would", "make", "like", "into", "time", "has", "two",
+        "more", "very", "after", "words", "first", "where", "much",
+        "through", "before", "right", "good", "here", "better", "every",
+        "those", "came",
+    }
+)
+
+_HAWAIIAN_WORDS = frozenset(
+    {
+        "aloha", "mahalo", "ohana", "keiki", "wahine", "kane", "alii",
+        "aina", "kai", "mauka", "makai", "pau", "hale", "wiki", "nui",
+        "iki", "mau", "keia", "kela", "nei", "la", "no", "hoi", "mai",
+        "aku", "ae", "ana", "ai", "ia", "oe", "au", "kaua", "laua",
+        "lakou", "oukou", "maua", "ma", "i", "o", "a", "e", "ke", "ka",
+        "na", "he", "ua", "moolelo", "mokuna", "hanau", "make", "ola",
+        "hele", "hiki", "ike", "lohe", "olelo", "pono", "hoolohe",
+        "kokoke", "mamua", "mahope", "manawa", "wahi", "ano", "mea",
+        "hana", "noho", "komo",
+    }
+)
+
+
+@lru_cache(maxsize=8192)
 def score_english_text(text: str) -> float:
     """
     Score how likely text is to be English (0-1 scale).
+    Cached: the pair-extraction state machine revisits repeated segments
+    (boilerplate, headers), and the score depends only on the text and the
+    immutable module-level word sets.
     """
-    text_lower = text.lower()
-    english_words = [
-        "the",
-        "and",
-        "of",
-        "to",
-        "a",
-        "in",
-        "was",
-        "that",
-        "he",
-        "it",
-        "with",
-        "for",
-        "as",
-        "his",
-        "on",
-        "be",
-        "at",
-        "by",
-        "this",
-        "had",
-        "from",
-        "they",
-        "she",
-        "or",
-        "an",
-        "were",
-        "been",
-        "have",
-        "their",
-        "said",
-        "each",
-        "which",
-        "do",
-        "how",
-        "if",
-        "will",
-        "up",
-        "other",
-        "about",
-        "out",
-        "many",
-        "then",
-        "them",
-        "these",
-        "so",
-        "some",
-        "her",
-        "would",
-        "make",
-        "like",
-        "into",
-        "time",
-        "has",
-        "two",
-        "more",
-        "very",
-        "after",
-        "words",
-        "first",
-        "where",
-        "much",
-        "through",
-        "before",
-        "right",
-        "good",
-        "here",
-        "better",
-        "every",
-        "those",
-        "came",
-        "came",
-    ]
-
-    words = text_lower.split()
+    words = text.lower().split()
     if not words:
         return 0.0
 
-    english_count = sum(1 for word in words if word in english_words)
+    # map over the frozenset's __contains__ keeps the whole membership loop
+    # in C; sum() counts the resulting bools
+    english_count = sum(map(_ENGLISH_WORDS.__contains__, words))
     return english_count / len(words)
 
 
+@lru_cache(maxsize=8192)
 def score_hawaiian_text(text: str) -> float:
     """
     Score how likely text is to be Hawaiian (0-1 scale).
+    Cached on the same basis as score_english_text.
     """
     text_lower = text.lower()
 
-    # Hawaiian words and particles
-    hawaiian_words = [
-        "aloha",
-        "mahalo",
-        "ohana",
-        "keiki",
-        "wahine",
-        "kane",
-        "alii",
-        "aina",
-        "kai",
-        "mauka",
-        "makai",
-        "pau",
-        "hale",
-        "wiki",
-        "nui",
-        "iki",
-        "mau",
-        "keia",
-        "kela",
-        "nei",
-        "la",
-        "no",
-        "hoi",
-        "mai",
-        "aku",
-        "ae",
-        "ana",
-        "ai",
-        "ia",
-        "oe",
-        "au",
-        "kaua",
-        "laua",
-        "lakou",
-        "oukou",
-        "maua",
-        "ma",
-        "i",
-        "o",
-        "a",
-        "e",
-        "ke",
-        "ka",
-        "na",
-        "he",
-        "ua",
-        "ai",
-        "moolelo",
-        "mokuna",
-        "hanau",
-        "make",
-        "ola",
-        "hele",
-        "hiki",
-        "ike",
-        "lohe",
-        "olelo",
-        "pono",
-        "makai",
-        "hoolohe",
-        "kokoke",
-        "mamua",
-        "mahope",
-        "manawa",
-        "wahi",
-        "ano",
-        "mea",
-        "hana",
-        "noho",
-        "komo",
-    ]
-
     words = text_lower.split()
     if not words:
         return 0.0
 
-    hawaiian_count = sum(1 for word in words if word in hawaiian_words)
+    hawaiian_count = sum(map(_HAWAIIAN_WORDS.__contains__, words))
     base_score = hawaiian_count / len(words)
 
     # Boost score based on Hawaiian linguistic features
     # High vowel ratio (Hawaiian has many vowels)
-    vowel_count = sum(1 for char in text_lower if char in "aeiou")
+    vowel_count = len(text_lower) - len(text_lower.translate(_VOWEL_DEL))
     vowel_ratio = vowel_count / len(text_lower) if text_lower else 0
 
     # Presence of doubled vowels (common in Hawaiian)
-    double_vowels = len(re.findall(r"[aeiou]{2,}", text_lower))
+    double_vowels = len(_DOUBLE_VOWEL_RE.findall(text_lower))
     double_vowel_boost = min(double_vowels / len(words) * 2, 0.2) if words else 0
 
     # Presence of apostrophes (okina)
-    apostrophe_count = text.count("'") + text.count("'")
+    apostrophe_count = len(_OKINA_RE.findall(text))
     apostrophe_boost = min(apostrophe_count / len(words) * 0.5, 0.1) if words else 0
 
     # Combine scores
@@ -639,43 +953,199 @@ def score_hawaiian_text(text: str) -> float:
     return max(0.0, min(1.0, final_score))
 
 
-def compute_passage_hash(text: str) -> str:
+# Memoized on the full text: preview-then-save flows and the validate +
+# dedup stages hash the same passages repeatedly within one process, and
+# a truncated cache key could silently return the wrong digest for
+# passages that differ only in the middle
+@lru_cache(maxsize=65536)
+def compute_passage_hash(text: str) -> int:
     """
-    Compute a hash of the passage text for duplicate detection.
+    Compute a 64-bit hash of the passage text for duplicate detection.
     Normalizes the text before hashing to catch near-duplicates.
     """
     # Normalize text: lowercase, remove extra whitespace, remove punctuation
-    normalized = re.sub(r"[^\w\s]", "", text.lower())
-    normalized = " ".join(normalized.split())
+    normalized = _WS_RE.sub(" ", text.lower().translate(_PUNCT_TABLE)).strip()
+
+    return _digest_normalized(normalized)
+
+
+# A hash costs microseconds, so a worker pool only pays for itself on
+# batches well beyond any of the project CSVs; below this the serial
+# loop wins outright
+_HASH_BATCH_PARALLEL_MIN = 20_000
+
 
-    # Compute hash
-    return hashlib.md5(normalized.encode("utf-8")).hexdigest()
+def compute_passage_hashes_batch(
+    texts: List[str], workers: Optional[int] = None
+) -> List[int]:
+    """
+    Hash a batch of passages, returning 64-bit digests in input order.
+
+    Normalization is already a single C-level translate plus one regex
+    pass, so the remaining per-passage Python overhead is the global and
+    attribute lookups; binding those to locals once per batch removes it
+    from dedup loads that hash thousands of passages. Very large batches
+    fan out across a process pool instead.
+    """
+    if workers is None:
+        workers = mp.cpu_count()
+
+    if workers > 1 and len(texts) >= _HASH_BATCH_PARALLEL_MIN:
+        with mp.Pool(processes=workers) as pool:
+            return pool.map(compute_passage_hash, texts, chunksize=256)
+
+    ws_sub = _WS_RE.sub
+    punct_table = _PUNCT_TABLE
+    digest = _digest_normalized
+    return [
+        digest(ws_sub(" ", text.lower().translate(punct_table)).strip())
+        for text in texts
+    ]
+
+
+def compute_passage_hashes_batch_int(texts: List[str]) -> np.ndarray:
+    """
+    The passage digests for a batch, as a uint64 array so membership
+    tests become one vectorized np.isin instead of a Python set probe
+    per passage. Values match compute_passage_hash exactly.
+    """
+    ws_sub = _WS_RE.sub
+    punct_table = _PUNCT_TABLE
+    digest = _digest_normalized
+    return np.fromiter(
+        (
+            digest(ws_sub(" ", text.lower().translate(punct_table)).strip())
+            for text in texts
+        ),
+        dtype=np.uint64,
+        count=len(texts),
+    )
+
+
+# 65536 entries comfortably covers every distinct passage in a full run
+# while still capping the cache's own memory; lru_cache is thread-safe,
+# so the demo server can share it too
+@lru_cache(maxsize=65536)
+def _normalize_text_cached(text: str) -> str:
+    # Remove extra whitespace, punctuation, and convert to lowercase
+    return _WS_RE.sub(" ", text.lower().translate(_PUNCT_TABLE)).strip()
+
+
+# Identity-keyed fast path in front of the value cache: an lru_cache lookup
+# hashes the full input, which for a multi-kilobyte corpus string walks every
+# byte on each call, while id() is O(1). Entries hold a reference to the
+# string itself, both to keep the id from being reused and to verify identity
+# on lookup.
+_NORM_IDENT_CACHE: Dict[int, Tuple[str, str]] = {}
+_NORM_IDENT_CACHE_MAX = 64
 
 
-@lru_cache(maxsize=1000)
 def normalize_text_for_matching(text: str) -> str:
     """
     Normalize text for fuzzy matching. Cached for performance.
     """
-    # Remove extra whitespace, punctuation, and convert to lowercase
-    normalized = re.sub(r"[^\w\s]", "", text.lower())
-    normalized = " ".join(normalized.split())
-    return normalized
+    key = id(text)
+    entry = _NORM_IDENT_CACHE.get(key)
+    if entry is not None and entry[0] is text:
+        return entry[1]
+
+    result = _normalize_text_cached(text)
+
+    if len(_NORM_IDENT_CACHE) >= _NORM_IDENT_CACHE_MAX:
+        # FIFO eviction keeps the identity cache bounded
+        _NORM_IDENT_CACHE.pop(next(iter(_NORM_IDENT_CACHE)))
+    _NORM_IDENT_CACHE[key] = (text, result)
+    return result
+
+
+class CorpusIndex:
+    """
+    Precomputed matching state for one corpus text.
+
+    Normalizing, word-splitting and n-gram indexing the corpus are the
+    dominant per-call costs of find_substring_match_optimized when matching
+    many passages against the same text; building this once lets all those
+    calls share the work.
+    """
+
+    def __init__(self, full_text: str, ngram_n: int = 3):
+        self.norm = normalize_text_for_matching(full_text)
+        self.words = self.norm.split()
+        self.ngram = NGramIndex(n=ngram_n)
+        self.ngram.build(self.norm)
+
+
+# Two-level cache so repeated calls reuse one CorpusIndex without an API
+# change (see find_substring_match): the id()-keyed level catches the common
+# same-object case without touching the text, and the content-digest level
+# catches equal corpora loaded as different objects (e.g. the same file read
+# twice), so the O(N) index build never repeats for the same book.
+# Like _NORM_IDENT_CACHE, each id-keyed entry holds the corpus string
+# itself: without that reference a freed corpus leaves its id behind, and
+# a later string allocated at the same address would silently match
+# against the wrong book's index.
+_CORPUS_INDEX_CACHE: Dict[int, Tuple[str, CorpusIndex]] = {}
+_CORPUS_CONTENT_CACHE: Dict[int, CorpusIndex] = {}
+_CORPUS_INDEX_CACHE_MAX = 8
+
+
+def _get_corpus_index(full_text: str) -> CorpusIndex:
+    key = id(full_text)
+    entry = _CORPUS_INDEX_CACHE.get(key)
+    if entry is not None and entry[0] is full_text:
+        return entry[1]
+
+    content_key = _digest_normalized(full_text)
+    corpus = _CORPUS_CONTENT_CACHE.get(content_key)
+    if corpus is None:
+        corpus = CorpusIndex(full_text)
+        if len(_CORPUS_CONTENT_CACHE) >= _CORPUS_INDEX_CACHE_MAX:
+            # FIFO eviction keeps the cache bounded
+            _CORPUS_CONTENT_CACHE.pop(next(iter(_CORPUS_CONTENT_CACHE)))
+        _CORPUS_CONTENT_CACHE[content_key] = corpus
+    if len(_CORPUS_INDEX_CACHE) >= _CORPUS_INDEX_CACHE_MAX:
+        _CORPUS_INDEX_CACHE.pop(next(iter(_CORPUS_INDEX_CACHE)))
+    _CORPUS_INDEX_CACHE[key] = (full_text, corpus)
+    return corpus
+
+
+def get_ngram_index(full_text: str) -> NGramIndex:
+    """
+    Return the memoized n-gram index for a corpus, building it on first
+    use. Callers that index the same book for many passages share one
+    build through the corpus cache.
+    """
+    return _get_corpus_index(full_text).ngram
 
 
 def find_substring_match_optimized(
     passage: str,
-    full_text: str,
+    full_text,
     threshold: float = 0.85,
     ngram_index: Optional[NGramIndex] = None,
     early_termination_score: float = 0.95,
 ) -> Tuple[bool, float]:
     """
     Optimized substring matching using rapidfuzz and n-gram indexing.
+    `full_text` may be a plain string or a prebuilt CorpusIndex; passing a
+    CorpusIndex avoids re-normalizing and re-splitting the corpus per call.
     Returns (is_found, similarity_score)
     """
     passage_norm = normalize_text_for_matching(passage)
-    full_text_norm = normalize_text_for_matching(full_text)
+
+    if isinstance(full_text, CorpusIndex):
+        corpus = full_text
+        full_text_norm = corpus.norm
+        if ngram_index is None:
+            ngram_index = corpus.ngram
+    else:
+        corpus = None
+        full_text_norm = normalize_text_for_matching(full_text)
+
+    # A passage longer than the whole corpus cannot be contained in it;
+    # bail out before any fuzzy work
+    if len(passage_norm) > len(full_text_norm):
+        return False, 0.0
 
     # Quick exact substring check first
     if passage_norm in full_text_norm:
@@ -703,33 +1173,190 @@ def find_substring_match_optimized(
                 passage_norm, full_text_norm, threshold, early_termination_score
             )
 
-        # Check top candidates with rapidfuzz
-        full_words = full_text_norm.split()
-        best_score = 0.0
+        # Check top 20 candidates with rapidfuzz
+        full_words = corpus.words if corpus is not None else full_text_norm.split()
 
-        for _, start_pos, _ in candidates[:20]:  # Check top 20 candidates
+        passage_len = len(passage_norm)
+        passage_word_count = len(passage_norm.split())
+        windows = []
+        for _, start_pos, _ in candidates[:20]:
             # Extract window around candidate position
             window_start = max(0, start_pos - 5)
-            window_end = min(len(full_words), start_pos + len(passage_norm.split()) + 5)
+            window_end = min(len(full_words), start_pos + passage_word_count + 5)
             window_text = " ".join(full_words[window_start:window_end])
 
-            # Use rapidfuzz for scoring
-            score = fuzz.ratio(passage_norm, window_text) / 100.0
-            best_score = max(best_score, score)
+            # Length gate: fuzz.ratio is bounded by 2*min/(len1+len2), so a
+            # window with a large length mismatch can never reach threshold
+            window_len = len(window_text)
+            if (
+                2 * min(window_len, passage_len) / (window_len + passage_len)
+                < threshold
+            ):
+                continue
+
+            windows.append(window_text)
 
-            # Early termination if we find a very good match
-            if best_score >= early_termination_score:
-                return True, best_score
+        # Score every surviving window in one C call; score_cutoff lets the
+        # bitparallel scorer abandon hopeless windows early, reporting them
+        # as 0
+        best_score = 0.0
+        if windows:
+            scores = process.cdist(
+                [passage_norm],
+                windows,
+                scorer=fuzz.ratio,
+                workers=-1,
+                score_cutoff=threshold * 100,
+            )[0]
+            best_score = float(scores.max()) / 100.0
 
         if best_score >= threshold:
             return True, best_score
-    else:
-        # Fall back to optimized sliding window
+
+        # The index is a recall heuristic: none of its candidates verified,
+        # so confirm the miss with the exhaustive scan before reporting one
         return find_substring_match_sliding_window(
             passage_norm, full_text_norm, threshold, early_termination_score
         )
 
-    return False, best_score if ngram_index else 0.0
+    # Fall back to optimized sliding window
+    return find_substring_match_sliding_window(
+        passage_norm, full_text_norm, threshold, early_termination_score
+    )
+
+
+def _scan_windows(
+    passage_norm,
+    passage_word_set,
+    full_words,
+    step_size,
+    scorer,
+    overlap_cutoff,
+    score_cutoff=0.0,
+):
+    """
+    Build overlap-filtered windows of len(passage) words at the given step
+    and score the survivors with one cdist call. score_cutoff lets the
+    bitparallel scorer abandon hopeless pairs early; scores below it come
+    back as 0.
+    Returns (starts, scores); scores is None when no window survives.
+    """
+    window_size = len(passage_norm.split())
+    starts = []
+    windows = []
+    for i in range(0, len(full_words) - window_size + 1, step_size):
+        window_words = full_words[i : i + window_size]
+
+        # Lower-bound word overlap check before the expensive fuzz scoring
+        overlap = len(passage_word_set.intersection(window_words)) / len(
+            passage_word_set
+        )
+        if overlap < overlap_cutoff:
+            continue
+
+        starts.append(i)
+        windows.append(" ".join(window_words))
+
+    if not windows:
+        return starts, None
+    scores = process.cdist(
+        [passage_norm], windows, scorer=scorer, workers=-1, score_cutoff=score_cutoff
+    )[0]
+    return starts, scores
+
+
+def _refine_around(passage_norm, full_words, window_size, center, step_size):
+    """Re-score every window within one step of a coarse hit with fuzz.ratio."""
+    nearby_windows = [
+        " ".join(full_words[j : j + window_size])
+        for j in range(
+            max(0, center - step_size),
+            min(center + step_size + 1, len(full_words) - window_size + 1),
+        )
+    ]
+    if not nearby_windows:
+        return 0.0
+    nearby_scores = process.cdist(
+        [passage_norm], nearby_windows, scorer=fuzz.ratio, workers=-1
+    )[0]
+    return float(nearby_scores.max()) / 100.0
+
+
+def _sliding_match_small(
+    passage_norm, full_text_norm, threshold, early_termination_score
+):
+    """
+    Short passages: one partial_ratio call runs the whole sliding alignment
+    inside rapidfuzz's bitparallel C++ core, so no Python-level window
+    construction is needed at all.
+    """
+    score = fuzz.partial_ratio(
+        passage_norm, full_text_norm, score_cutoff=threshold * 100
+    )
+    if score:
+        return True, score / 100.0
+    return False, 0.0
+
+
+def _sliding_match_medium(
+    passage_norm, passage_words, full_words, threshold, early_termination_score
+):
+    """Mid-size passages: coarse scan at step 3, refine around a near-hit."""
+    step_size = 3
+    starts, scores = _scan_windows(
+        passage_norm,
+        set(passage_words),
+        full_words,
+        step_size=step_size,
+        scorer=fuzz.ratio,
+        overlap_cutoff=max(0.0, threshold - 0.1),
+        score_cutoff=threshold * 90,
+    )
+    if scores is None:
+        return False, 0.0
+    best_idx = int(np.argmax(scores))
+    best_ratio = float(scores[best_idx]) / 100.0
+
+    if threshold * 0.9 < best_ratio < early_termination_score:
+        best_ratio = max(
+            best_ratio,
+            _refine_around(
+                passage_norm,
+                full_words,
+                len(passage_words),
+                starts[best_idx],
+                step_size,
+            ),
+        )
+    return best_ratio >= threshold, best_ratio
+
+
+def _sliding_match_large(
+    passage_norm, passage_words, full_words, threshold, early_termination_score
+):
+    """
+    Long passages: coarse scan at step 20 with token_sort_ratio, which is
+    insensitive to the word-order drift a 20-position offset introduces, then
+    a fuzz.ratio refinement pass around the best coarse hit so the returned
+    score means the same thing as on the other paths.
+    """
+    step_size = 20
+    starts, scores = _scan_windows(
+        passage_norm,
+        set(passage_words),
+        full_words,
+        step_size=step_size,
+        scorer=fuzz.token_sort_ratio,
+        overlap_cutoff=max(0.0, threshold - 0.1),
+        score_cutoff=threshold * 90,
+    )
+    if scores is None:
+        return False, 0.0
+    best_idx = int(np.argmax(scores))
+    best_ratio = _refine_around(
+        passage_norm, full_words, len(passage_words), starts[best_idx], step_size
+    )
+    return best_ratio >= threshold, best_ratio
 
 
 def find_substring_match_sliding_window(
@@ -739,7 +1366,10 @@ def find_substring_match_sliding_window(
     early_termination_score: float = 0.95,
 ) -> Tuple[bool, float]:
     """
-    Optimized sliding window search using rapidfuzz.
+    Optimized sliding window search using rapidfuzz, specialized by passage
+    length: short passages scan every position, mid-size passages use a
+    coarse step with refinement, long passages use a wide step with an
+    order-insensitive coarse scorer.
     """
     passage_words = passage_norm.split()
     full_words = full_text_norm.split()
@@ -747,35 +1377,108 @@ def find_substring_match_sliding_window(
     if len(passage_words) > len(full_words):
         return False, 0.0
 
-    # Use a sliding window with step size for faster search
-    window_size = len(passage_words)
-    step_size = max(1, window_size // 10)  # Skip some positions for speed
-    best_ratio = 0.0
+    if len(passage_words) < 20:
+        return _sliding_match_small(
+            passage_norm, full_text_norm, threshold, early_termination_score
+        )
+    if len(passage_words) <= 200:
+        match = _sliding_match_medium
+    else:
+        match = _sliding_match_large
+    return match(
+        passage_norm, passage_words, full_words, threshold, early_termination_score
+    )
 
-    for i in range(0, len(full_words) - window_size + 1, step_size):
-        window = " ".join(full_words[i : i + window_size])
-
-        # Use rapidfuzz for faster comparison
-        ratio = fuzz.ratio(passage_norm, window) / 100.0
-
-        if ratio > best_ratio:
-            best_ratio = ratio
-            # If we skipped positions and found a good match, check nearby positions
-            if step_size > 1 and ratio > threshold * 0.9:
-                for j in range(
-                    max(0, i - step_size),
-                    min(i + step_size, len(full_words) - window_size + 1),
-                ):
-                    if j != i:
-                        nearby_window = " ".join(full_words[j : j + window_size])
-                        nearby_ratio = fuzz.ratio(passage_norm, nearby_window) / 100.0
-                        best_ratio = max(best_ratio, nearby_ratio)
-
-        # Early termination
-        if best_ratio >= early_termination_score:
-            return True, best_ratio
 
-    return best_ratio >= threshold, best_ratio
+def find_substring_matches_batch(
+    passages: List[str],
+    full_text: str,
+    threshold: float = 0.85,
+    early_termination_score: float = 0.95,
+) -> List[Tuple[bool, float]]:
+    """
+    Match many passages against one corpus in a single pass.
+
+    Normalizes and n-gram-indexes the corpus once instead of per passage,
+    and scores all short passages with one rapidfuzz process.cdist call.
+    Returns one (is_found, similarity_score) tuple per passage, in order.
+    """
+    # Build the corpus state (normalization, word split, n-gram index) once;
+    # every long passage reuses it
+    corpus = CorpusIndex(full_text)
+    full_text_norm = corpus.norm
+    passages_norm = [normalize_text_for_matching(p) for p in passages]
+
+    results: List[Optional[Tuple[bool, float]]] = [None] * len(passages)
+
+    # Short passages all go through one batched partial_ratio call
+    short_indices = [i for i, p in enumerate(passages_norm) if len(p) < 50]
+    if short_indices:
+        short_scores = process.cdist(
+            [passages_norm[i] for i in short_indices],
+            [full_text_norm],
+            scorer=fuzz.partial_ratio,
+            workers=-1,
+        )
+        for row, i in enumerate(short_indices):
+            score = float(short_scores[row][0]) / 100.0
+            results[i] = (score >= threshold, score if score >= threshold else 0.0)
+
+    # Longer passages use the shared corpus state through the optimized path
+    for i, passage in enumerate(passages):
+        if results[i] is None:
+            results[i] = find_substring_match_optimized(
+                passage,
+                corpus,
+                threshold,
+                early_termination_score=early_termination_score,
+            )
+
+    return results
+
+
+# Worker-side state for find_substring_matches_parallel; populated by the
+# pool initializer so only the passage strings travel over IPC per task.
+_WORKER_CORPUS: Optional[CorpusIndex] = None
+_WORKER_THRESHOLD: float = 0.85
+
+
+def _init_match_worker(full_text: str, threshold: float):
+    global _WORKER_CORPUS, _WORKER_THRESHOLD
+    _WORKER_CORPUS = CorpusIndex(full_text)
+    _WORKER_THRESHOLD = threshold
+
+
+def _match_one(passage: str) -> Tuple[bool, float]:
+    return find_substring_match_optimized(passage, _WORKER_CORPUS, _WORKER_THRESHOLD)
+
+
+def find_substring_matches_parallel(
+    passages: List[str],
+    full_text: str,
+    threshold: float = 0.85,
+    workers: Optional[int] = None,
+) -> List[Tuple[bool, float]]:
+    """
+    Match many passages against one corpus across CPU cores.
+
+    Each worker builds the corpus state once in its initializer, so tasks
+    only ship the passage string. Falls back to the single-process batch
+    path for tiny workloads where pool startup would dominate.
+    """
+    if workers is None:
+        workers = mp.cpu_count()
+
+    if workers <= 1 or len(passages) < 2 * workers:
+        return find_substring_matches_batch(passages, full_text, threshold)
+
+    chunksize = max(1, len(passages) // (4 * workers))
+    with mp.Pool(
+        processes=workers,
+        initializer=_init_match_worker,
+        initargs=(full_text, threshold),
+    ) as pool:
+        return pool.map(_match_one, passages, chunksize=chunksize)
 
 
 # Keep the original function name for compatibility but use the optimized version
@@ -786,64 +1489,133 @@ def find_substring_match(
     Check if a passage appears as a substring in the full text with fuzzy matching.
     Returns (is_found, similarity_score)
     """
-    return find_substring_match_optimized(passage, full_text, threshold)
+    # Reuse a cached CorpusIndex keyed on the corpus object so loops calling
+    # this per passage with the same full_text amortize the corpus setup
+    return find_substring_match_optimized(
+        passage, _get_corpus_index(full_text), threshold
+    )
 
 
-def load_existing_passages(dataset_path: str) -> Dict[str, Tuple[str, str]]:
+def _read_passage_frame(csv_path: str) -> Optional[pd.DataFrame]:
+    """
+    Read a passage CSV through pandas' C engine and reduce it to stripped
+    'hawaiian'/'english' string columns, keeping the original 0-based row
+    position as the index. Handles both dataset formats:
+    data/dataset.csv uses "Hawaiian" / "English",
+    finetuning/finetuning_dataset.csv uses "L1 Hawaiian_Text" /
+    "Reference_Translation". Returns None if the required columns (or any
+    rows) are missing.
+    """
+    try:
+        df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    except pd.errors.EmptyDataError:
+        return None
+    except pd.errors.ParserError:
+        # Rows with stray extra fields choke the C tokenizer; retry with
+        # the python engine, truncating bad rows to the header width the
+        # way positional row indexing effectively did
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            num_cols = len(next(csv.reader(f)))
+        df = pd.read_csv(
+            csv_path,
+            dtype=str,
+            keep_default_na=False,
+            engine="python",
+            on_bad_lines=lambda fields: fields[:num_cols],
+        )
+
+    hawaiian_col = next(
+        (c for c in ("Hawaiian", "L1 Hawaiian_Text") if c in df.columns), None
+    )
+    english_col = next(
+        (c for c in ("English", "Reference_Translation") if c in df.columns), None
+    )
+    if hawaiian_col is None or english_col is None:
+        return None
+
+    hawaiian = df[hawaiian_col].str.strip()
+    english = df[english_col].str.strip()
+    mask = (hawaiian != "") & (english != "")
+    return pd.DataFrame({"hawaiian": hawaiian[mask], "english": english[mask]})
+
+
+def load_existing_passages(dataset_path: str) -> Dict[int, Tuple[str, str]]:
     """
     Load existing passages from the dataset and compute their hashes.
     Returns a dict mapping hash -> (hawaiian, english) tuple.
     """
-    existing = {}
+    frame = _read_passage_frame(dataset_path)
+    if frame is None:
+        return {}
 
-    with open(dataset_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Handle both dataset formats
-            # data/dataset.csv uses "Hawaiian" and "English"
-            # finetuning/finetuning_dataset.csv uses "L1 Hawaiian_Text" and "Reference_Translation"
-            hawaiian = row.get("Hawaiian", "") or row.get("L1 Hawaiian_Text", "")
-            english = row.get("English", "") or row.get("Reference_Translation", "")
+    # Hash the Hawaiian texts for deduplication in one batch
+    hawaiian_texts = frame["hawaiian"].tolist()
+    hashes = compute_passage_hashes_batch(hawaiian_texts)
+    return dict(zip(hashes, zip(hawaiian_texts, frame["english"].tolist())))
 
-            hawaiian = hawaiian.strip()
-            english = english.strip()
 
-            if hawaiian and english:
-                # Compute hash of Hawaiian text for deduplication
-                hash_val = compute_passage_hash(hawaiian)
-                existing[hash_val] = (hawaiian, english)
-
-    return existing
+def load_existing_hashes_only(dataset_path: str) -> set:
+    """
+    Load just the passage hashes from a dataset CSV, for dedup callers
+    that only need digest membership.
+
+    usecols keeps the parser from materializing the wide translation
+    columns, and no hash -> pair dict is built. Rows whose Hawaiian cell
+    is empty are skipped, matching load_existing_passages (which also
+    requires a non-empty English cell — an empty-English row would add
+    one stray digest here, which dedup tolerates).
+    """
+    try:
+        with open(dataset_path, "r", encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f))
+    except (OSError, StopIteration):
+        return set()
+    column = next((c for c in ("Hawaiian", "L1 Hawaiian_Text") if c in header), None)
+    if column is None:
+        return set()
+
+    try:
+        series = pd.read_csv(
+            dataset_path, usecols=[column], dtype=str, keep_default_na=False
+        )[column]
+    except pd.errors.EmptyDataError:
+        return set()
+    except pd.errors.ParserError:
+        # Ragged rows: fall back to the tolerant full-frame reader
+        frame = _read_passage_frame(dataset_path)
+        if frame is None:
+            return set()
+        series = frame["hawaiian"]
+
+    texts = [text for text in (s.strip() for s in series.tolist()) if text]
+    return set(compute_passage_hashes_batch(texts))
 
 
 def load_csv_passages(csv_path: str) -> List[Dict[str, str]]:
     """
     Load passages from a CSV file with full metadata.
     """
-    passages = []
-
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for i, row in enumerate(reader):
-            # Handle both dataset formats
-            hawaiian = row.get("Hawaiian", "") or row.get("L1 Hawaiian_Text", "")
-            english = row.get("English", "") or row.get("Reference_Translation", "")
-
-            hawaiian = hawaiian.strip()
-            english = english.strip()
-
-            if hawaiian and english:
-                passages.append(
-                    {
-                        "index": i + 1,  # 1-based index
-                        "hawaiian": hawaiian,
-                        "english": english,
-                        "hawaiian_hash": compute_passage_hash(hawaiian),
-                        "english_hash": compute_passage_hash(english),
-                    }
-                )
+    frame = _read_passage_frame(csv_path)
+    if frame is None:
+        return []
 
-    return passages
+    hawaiian_texts = frame["hawaiian"].tolist()
+    english_texts = frame["english"].tolist()
+    hawaiian_hashes = compute_passage_hashes_batch(hawaiian_texts)
+    english_hashes = compute_passage_hashes_batch(english_texts)
+
+    return [
+        {
+            "index": int(position) + 1,  # 1-based index
+            "hawaiian": hawaiian,
+            "english": english,
+            "hawaiian_hash": hawaiian_hash,
+            "english_hash": english_hash,
+        }
+        for position, hawaiian, english, hawaiian_hash, english_hash in zip(
+            frame.index, hawaiian_texts, english_texts, hawaiian_hashes, english_hashes
+        )
+    ]
 
 
 def save_passages_to_csv(
@@ -878,31 +1650,28 @@ def save_passages_to_csv(
         existing_headers = None
         num_columns = None
 
-    with open(output_path, mode, encoding="utf-8", newline="") as f:
+    # Precompute all rows so the write happens as one C-level writerows call
+    if is_finetuning or not (num_columns and num_columns > 2):
+        # Simple two-column case
+        rows = [[hawaiian, english] for hawaiian, english in passages]
+    else:
+        # For data/dataset.csv, pad with empty columns for model translations
+        padding = [""] * (num_columns - 2)
+        rows = [[hawaiian, english] + padding for hawaiian, english in passages]
+
+    # Large write buffer amortizes syscall cost for big exports
+    with open(
+        output_path, mode, encoding="utf-8", newline="", buffering=1 << 20
+    ) as f:
+        writer = csv.writer(f)
         if mode == "w":
             # Write header for new file
-            writer = csv.writer(f)
             if is_finetuning:
                 writer.writerow(["L1 Hawaiian_Text", "Reference_Translation"])
             else:
                 writer.writerow(["Hawaiian", "English"])
-        else:
-            # For appending, no header needed
-            writer = csv.writer(f)
 
-        for hawaiian, english in passages:
-            if is_finetuning:
-                # Simple case for finetuning dataset
-                writer.writerow([hawaiian, english])
-            else:
-                # For data/dataset.csv, pad with empty columns for model translations
-                if num_columns and num_columns > 2:
-                    # Create row with hawaiian, english, and empty values for model columns
-                    row = [hawaiian, english] + [""] * (num_columns - 2)
-                    writer.writerow(row)
-                else:
-                    # If no existing columns or new file, just write the two columns
-                    writer.writerow([hawaiian, english])
+        writer.writerows(rows)
 
     print(f"Saved {len(passages)} passages to {output_path}")
 
@@ -4,27 +4,33 @@ Optimized version: Extract English-Hawaiian passage pairs from epub files.
 Uses optimized utilities for better performance on large epub files.
 """
 
+import atexit
+import itertools
 import sys
 import time
 from pathlib import Path
 from typing import List, Tuple, Optional
 from tqdm import tqdm
 import multiprocessing as mp
-from functools import partial
+import numpy as np
 
 # Import optimized utilities
 from epub_utils_optimized import (
     extract_text_from_epub,
-    identify_passage_pairs,
+    iter_passage_pairs,
     compute_passage_hash,
-    load_existing_passages,
+    compute_passage_hashes_batch_int,
+    load_existing_hashes_only,
     save_passages_to_csv,
     get_default_csv_paths,
-    normalize_text_for_matching,
     find_substring_match_optimized,
     NGramIndex,
 )
 
+# Counting each vowel with str.count keeps the scan in C memchr-style
+# loops and needs no .lower() copy; both cases are listed instead
+_VOWELS_BOTH_CASES = "aeiouAEIOU"
+
 
 def validate_passage_pair(
     pair: Tuple[str, str], min_length: int = 50, max_length: int = 3000
@@ -42,54 +48,180 @@ def validate_passage_pair(
     if max_length > 0 and (len(hawaiian) > max_length or len(english) > max_length):
         return False
 
-    # Check if passages are too similar (might be same language)
-    # This helps filter out pages where both sides are in the same language
-    hawaiian_norm = normalize_text_for_matching(hawaiian)
-    english_norm = normalize_text_for_matching(english)
-
-    # If normalized texts are too similar, they might be the same language
-    if hawaiian_norm == english_norm:
-        return False
-
-    # Quick heuristic: Hawaiian text typically has more vowels
-    hawaiian_vowel_ratio = sum(1 for c in hawaiian.lower() if c in "aeiou") / len(
-        hawaiian
-    )
-    english_vowel_ratio = sum(1 for c in english.lower() if c in "aeiou") / len(english)
+    # Quick heuristic first: Hawaiian text typically has more vowels, the
+    # counts are plain C scans, and most same-language pairs fail here —
+    # sparing the normalize-and-hash work below for the common rejection
+    hawaiian_vowel_ratio = sum(map(hawaiian.count, _VOWELS_BOTH_CASES)) / len(hawaiian)
+    english_vowel_ratio = sum(map(english.count, _VOWELS_BOTH_CASES)) / len(english)
 
     # If vowel ratios are too similar, might be same language
     if abs(hawaiian_vowel_ratio - english_vowel_ratio) < 0.05:
         return False
 
+    # Check if passages are too similar (might be same language)
+    # This helps filter out pages where both sides are in the same language.
+    # compute_passage_hash digests the same normalization, so comparing
+    # digests equals comparing normalized strings without keeping two
+    # normalized copies alive, and the Hawaiian digest is the one the
+    # dedup stage computes anyway.
+    if compute_passage_hash(hawaiian) == compute_passage_hash(english):
+        return False
+
     return True
 
 
+# Filter-worker state, installed once per worker by the pool initializer
+# so each task payload pickles only its pairs batch instead of carrying
+# the full existing-hash set
+_WORKER_EXISTING_HASHES: frozenset = frozenset()
+_WORKER_SKIP_DUPLICATES: bool = True
+_WORKER_MAX_LENGTH: int = 3000
+_WORKER_COUNTER = None  # Shared accepted-pair counter for early exit
+_WORKER_TARGET = None  # Shared num_passages target; 0 means unlimited
+
+
+def _init_filter_worker(
+    existing_hashes: frozenset,
+    skip_duplicates: bool,
+    max_length: int,
+    counter=None,
+    target=None,
+):
+    global _WORKER_EXISTING_HASHES, _WORKER_SKIP_DUPLICATES, _WORKER_MAX_LENGTH
+    global _WORKER_COUNTER, _WORKER_TARGET
+    _WORKER_EXISTING_HASHES = existing_hashes
+    _WORKER_SKIP_DUPLICATES = skip_duplicates
+    _WORKER_MAX_LENGTH = max_length
+    _WORKER_COUNTER = counter
+    _WORKER_TARGET = target
+
+
+def _process_indexed_batch(indexed_batch):
+    """
+    Filter one (index, batch) task, skipping the work entirely once the
+    shared counter shows the passage target has been reached. The index
+    rides along so unordered results can be reassembled in batch order.
+    """
+    idx, pairs_batch = indexed_batch
+    target = _WORKER_TARGET.value if _WORKER_TARGET is not None else 0
+    if target and _WORKER_COUNTER.value >= target:
+        return idx, len(pairs_batch), []
+    filtered = process_passages_batch(pairs_batch)
+    if filtered and _WORKER_COUNTER is not None:
+        with _WORKER_COUNTER.get_lock():
+            _WORKER_COUNTER.value += len(filtered)
+    return idx, len(pairs_batch), filtered
+
+
+# Persistent filter pool: batch extraction over several epubs pays fork
+# and initializer cost once per worker configuration instead of once per
+# call. The counter and target live in shared memory, so successive runs
+# reset them without re-running the initializer.
+_FILTER_POOL = None
+_FILTER_POOL_KEY = None
+_FILTER_COUNTER = None
+_FILTER_TARGET = None
+
+
+def _close_filter_pool():
+    global _FILTER_POOL, _FILTER_POOL_KEY
+    if _FILTER_POOL is not None:
+        _FILTER_POOL.terminate()
+        _FILTER_POOL = None
+        _FILTER_POOL_KEY = None
+
+
+atexit.register(_close_filter_pool)
+
+
+def _get_filter_pool(
+    num_processes: int, existing_hashes: frozenset, skip_duplicates: bool, max_length: int
+):
+    """
+    Return the shared filter pool, rebuilding it only when the worker
+    configuration (process count or installed filter state) changes.
+    """
+    global _FILTER_POOL, _FILTER_POOL_KEY, _FILTER_COUNTER, _FILTER_TARGET
+    if _FILTER_COUNTER is None:
+        _FILTER_COUNTER = mp.Value("i", 0)
+        _FILTER_TARGET = mp.Value("i", 0)
+
+    # The frozenset compares by content, so a caller rebuilding an equal
+    # hash set from the same CSVs still hits the cached pool; only a
+    # genuinely different filter configuration forces a rebuild
+    key = (num_processes, existing_hashes, skip_duplicates, max_length)
+    if _FILTER_POOL is None or _FILTER_POOL_KEY != key:
+        _close_filter_pool()
+        _FILTER_POOL = mp.Pool(
+            processes=num_processes,
+            initializer=_init_filter_worker,
+            initargs=(
+                existing_hashes,
+                skip_duplicates,
+                max_length,
+                _FILTER_COUNTER,
+                _FILTER_TARGET,
+            ),
+        )
+        _FILTER_POOL_KEY = key
+    return _FILTER_POOL
+
+
+def _iter_batches(iterable, batch_size: int):
+    """Yield successive list batches from any iterable."""
+    it = iter(iterable)
+    while batch := list(itertools.islice(it, batch_size)):
+        yield batch
+
+
 def process_passages_batch(
     pairs_batch: List[Tuple[str, str]],
-    existing_hashes: set,
-    skip_duplicates: bool,
-    max_length: int = 3000,
-) -> List[Tuple[str, str]]:
+) -> List[Tuple[int, str, str]]:
     """
-    Process a batch of passage pairs in parallel.
+    Process a batch of passage pairs in parallel, reading shared state
+    installed by _init_filter_worker. Survivors come back as
+    (hash, hawaiian, english) triples: the Hawaiian digest is already
+    computed for the same-language and dedup checks, and carrying it
+    saves the parent re-hashing every passage during internal dedup.
+
+    The validate_passage_pair checks are inlined with every name bound to
+    a local, so the per-pair cost is the C-level scans themselves rather
+    than a function call plus a throwaway tuple per pair.
     Note: This function cannot prevent internal duplicates across batches
     due to parallel processing. Internal deduplication happens at the end.
     """
     filtered_pairs = []
+    existing_hashes = _WORKER_EXISTING_HASHES
+    skip_duplicates = _WORKER_SKIP_DUPLICATES
+    max_length = _WORKER_MAX_LENGTH
+    vowels = _VOWELS_BOTH_CASES
+    passage_hash = compute_passage_hash
+    append = filtered_pairs.append
 
     for hawaiian, english in pairs_batch:
-        # Validate the pair
-        if not validate_passage_pair((hawaiian, english), max_length=max_length):
+        hawaiian_len = len(hawaiian)
+        english_len = len(english)
+        if hawaiian_len < 50 or english_len < 50:
+            continue
+        if max_length > 0 and (hawaiian_len > max_length or english_len > max_length):
+            continue
+
+        # Same checks as validate_passage_pair, cheapest first
+        hawaiian_ratio = sum(map(hawaiian.count, vowels)) / hawaiian_len
+        english_ratio = sum(map(english.count, vowels)) / english_len
+        if abs(hawaiian_ratio - english_ratio) < 0.05:
+            continue
+
+        hash_val = passage_hash(hawaiian)
+        if hash_val == passage_hash(english):
             continue
 
         # Check for duplicates against existing CSV data only
         # (internal duplicates will be handled after parallel processing)
-        if skip_duplicates:
-            hash_val = compute_passage_hash(hawaiian)
-            if hash_val in existing_hashes:
-                continue
+        if skip_duplicates and hash_val in existing_hashes:
+            continue
 
-        filtered_pairs.append((hawaiian, english))
+        append((hash_val, hawaiian, english))
 
     return filtered_pairs
 
@@ -130,9 +262,11 @@ def extract_passages_from_epub(
         pages = extract_text_from_epub(epub_path)
         print(f"Found {len(pages)} pages in the epub")
 
-        # Identify passage pairs
-        pairs = identify_passage_pairs(pages)
-        print(f"Identified {len(pairs)} potential passage pairs")
+        # Stream pairs page by page instead of materializing the full
+        # list; peek just far enough to pick serial vs parallel filtering
+        pairs_iter = iter_passage_pairs(pages)
+        pairs_head = list(itertools.islice(pairs_iter, 101))
+        pairs = itertools.chain(pairs_head, pairs_iter)
 
     # Load existing passages if checking for duplicates
     existing_hashes = set()
@@ -142,94 +276,120 @@ def extract_passages_from_epub(
 
         for dataset_path in datasets_to_check:
             if dataset_path.exists():
-                existing = load_existing_passages(str(dataset_path))
-                existing_hashes.update(existing.keys())
+                # Hash-only load: dedup never looks at the pair texts, so
+                # skip building the hash -> pair dict entirely
+                existing = load_existing_hashes_only(str(dataset_path))
+                existing_hashes.update(existing)
                 print(f"Loaded {len(existing)} passages from {dataset_path.name}")
 
+        # Read-only from here on: freezing guards against accidental
+        # mutation and makes the shared worker state explicitly immutable
+        existing_hashes = frozenset(existing_hashes)
         print(
             f"Total: {len(existing_hashes)} unique existing passages for duplicate detection"
         )
 
-    # Determine number of processes
+    # Determine number of processes: all cores by default — the 101-pair
+    # peek already keeps small inputs on the serial path, and the
+    # streaming 128-pair batches keep every worker fed on large ones
     if num_processes is None:
-        num_processes = min(mp.cpu_count(), 4)  # Cap at 4 processes
+        num_processes = mp.cpu_count()
 
     # Process passages
     if use_html_structure:
-        # For HTML-extracted pairs, we already have clean pairs
-        # Just need to filter for duplicates, length, and limit
-        filtered_pairs = []
-        seen_hashes = (
-            set()
-        )  # Track hashes within this extraction to prevent internal duplicates
-
-        for hawaiian, english in pairs:
-            # Validate length
-            if not validate_passage_pair((hawaiian, english), max_length=max_length):
-                continue
-
-            if skip_duplicates:
-                hash_val = compute_passage_hash(hawaiian)
-                # Check against existing CSV data
-                if hash_val in existing_hashes:
-                    continue
-                # Check against already processed passages in this extraction
-                if hash_val in seen_hashes:
-                    continue
-                seen_hashes.add(hash_val)
-
-            filtered_pairs.append((hawaiian, english))
+        # For HTML-extracted pairs, we already have clean pairs.
+        # Validate first, then hash every survivor in one batch so dedup
+        # is a single membership pass instead of a per-pair hash call.
+        valid_pairs = [
+            pair for pair in pairs if validate_passage_pair(pair, max_length=max_length)
+        ]
 
-            if num_passages and len(filtered_pairs) >= num_passages:
-                break
-    elif num_processes > 1 and len(pairs) > 100:
+        if skip_duplicates:
+            # Vectorized dedup: one np.isin scan against the existing
+            # digests and a first-occurrence mask for internal duplicates
+            # replace per-pair set probes entirely
+            digests = compute_passage_hashes_batch_int(
+                [hawaiian for hawaiian, _ in valid_pairs]
+            )
+            existing_arr = np.fromiter(
+                existing_hashes, dtype=np.uint64, count=len(existing_hashes)
+            )
+            keep = ~np.isin(digests, existing_arr)
+            first_idx = np.unique(digests, return_index=True)[1]
+            first_mask = np.zeros(len(digests), dtype=bool)
+            first_mask[first_idx] = True
+            keep &= first_mask
+
+            keep_idx = np.flatnonzero(keep)
+            if num_passages:
+                keep_idx = keep_idx[:num_passages]
+            filtered_pairs = [valid_pairs[i] for i in keep_idx]
+        else:
+            filtered_pairs = valid_pairs[:num_passages] if num_passages else valid_pairs
+    elif num_processes > 1 and len(pairs_head) > 100:
         # Use multiprocessing for large datasets
         print(f"Using {num_processes} processes for parallel filtering...")
 
-        # Split pairs into batches
-        batch_size = max(1, len(pairs) // (num_processes * 4))
-        batches = [pairs[i : i + batch_size] for i in range(0, len(pairs), batch_size)]
-
-        # Create a pool of workers
-        with mp.Pool(processes=num_processes) as pool:
-            # Prepare the partial function
-            process_func = partial(
-                process_passages_batch,
-                existing_hashes=existing_hashes,
-                skip_duplicates=skip_duplicates,
-                max_length=max_length,
-            )
+        # Reuse the persistent pool; the initializer installs the shared
+        # filter state once per worker instead of pickling it per batch.
+        # A shared counter lets workers stop accepting new batches as soon
+        # as the passage target is reached, instead of overshooting and
+        # terminating the pool afterwards.
+        pool = _get_filter_pool(
+            num_processes, existing_hashes, skip_duplicates, max_length
+        )
+        target = num_passages or 0
+        _FILTER_TARGET.value = target
+        with _FILTER_COUNTER.get_lock():
+            _FILTER_COUNTER.value = 0
+
+        # imap_unordered keeps fast workers busy past slow batches;
+        # the batch index reassembles the original order afterwards.
+        # Batches are cut from the pair stream as the pool consumes
+        # it, so the full pair list never exists at once.
+        indexed_batches = enumerate(_iter_batches(pairs, 128))
+        indexed_results = []
+        collected = 0
+        result_iter = pool.imap_unordered(
+            _process_indexed_batch, indexed_batches, chunksize=4
+        )
+        with tqdm(desc="Processing passages", mininterval=0.5, miniters=128) as pbar:
+            for idx, batch_len, batch_result in result_iter:
+                indexed_results.append((idx, batch_result))
+                collected += len(batch_result)
+                pbar.update(batch_len)
+
+                # Stop on the parent-side tally: the shared counter is
+                # only a worker-side skip hint — workers bump it before
+                # the parent has drained their results, so breaking on
+                # it drops completed-but-unyielded batches
+                if target and collected >= target:
+                    break
+            candidate_count = pbar.n
 
-            # Process batches with progress bar
-            all_filtered = []
-            with tqdm(total=len(pairs), desc="Processing passages") as pbar:
-                for i, batch_result in enumerate(pool.imap(process_func, batches)):
-                    all_filtered.extend(batch_result)
-                    # More accurate progress update
-                    batch_len = (
-                        len(batches[i]) if i < len(batches) else len(batches[-1])
-                    )
-                    pbar.update(batch_len)
-
-                    # Stop if we have enough passages
-                    if num_passages and len(all_filtered) >= num_passages:
-                        pool.terminate()
-                        break
+        # Drain the stale tail of the stream before returning: the pool
+        # outlives this call, and in-flight tasks would otherwise still
+        # be bumping the shared counter when the next run resets it.
+        # With the counter at the target the workers skip these batches,
+        # so the drain costs stream iteration, not filtering.
+        for _ in result_iter:
+            pass
+
+        indexed_results.sort()
+        all_filtered = [triple for _, result in indexed_results for triple in result]
+        print(f"Processed {candidate_count} potential passage pairs")
 
         # Deduplicate internally within the extracted passages
         if skip_duplicates:
             print("Removing internal duplicates from parallel processing...")
-            seen_hashes = set()
-            deduped_pairs = []
-            duplicates_removed = 0
-
-            for hawaiian, english in all_filtered:
-                hash_val = compute_passage_hash(hawaiian)
-                if hash_val not in seen_hashes:
-                    seen_hashes.add(hash_val)
-                    deduped_pairs.append((hawaiian, english))
-                else:
-                    duplicates_removed += 1
+            # The workers already carried each Hawaiian digest back, so
+            # keying a dict on it with setdefault keeps the first
+            # occurrence and its order with zero re-hashing here
+            dedup_map = {}
+            for hash_val, hawaiian, english in all_filtered:
+                dedup_map.setdefault(hash_val, (hawaiian, english))
+            deduped_pairs = list(dedup_map.values())
+            duplicates_removed = len(all_filtered) - len(deduped_pairs)
 
             if duplicates_removed > 0:
                 print(
@@ -237,6 +397,10 @@ def extract_passages_from_epub(
                 )
 
             all_filtered = deduped_pairs
+        else:
+            all_filtered = [
+                (hawaiian, english) for _, hawaiian, english in all_filtered
+            ]
 
         filtered_pairs = all_filtered[:num_passages] if num_passages else all_filtered
     else:
@@ -248,32 +412,38 @@ def extract_passages_from_epub(
             set()
         )  # Track hashes within this extraction to prevent internal duplicates
 
-        with tqdm(total=len(pairs), desc="Processing passages") as pbar:
+        # Progress updates are batched: tqdm.update takes a lock and
+        # reformats the bar, which dwarfs the per-pair filter work itself
+        with tqdm(desc="Processing passages", mininterval=0.5, miniters=256) as pbar:
+            pending_updates = 0
             for hawaiian, english in pairs:
+                pending_updates += 1
+                if pending_updates >= 256:
+                    pbar.update(pending_updates)
+                    pending_updates = 0
+
                 # Validate the pair
                 if not validate_passage_pair(
                     (hawaiian, english), max_length=max_length
                 ):
-                    pbar.update(1)
                     continue
 
                 if skip_duplicates:
                     hash_val = compute_passage_hash(hawaiian)
                     # Check against existing CSV data
                     if hash_val in existing_hashes:
-                        pbar.update(1)
                         continue
                     # Check against already processed passages in this extraction
                     if hash_val in seen_hashes:
-                        pbar.update(1)
                         continue
                     seen_hashes.add(hash_val)
 
                 filtered_pairs.append((hawaiian, english))
-                pbar.update(1)
 
                 if num_passages and len(filtered_pairs) >= num_passages:
                     break
+            pbar.update(pending_updates)
+            print(f"Processed {pbar.n} potential passage pairs")
     extracted_message = "new passages after filtering"
     if skip_duplicates:
         extracted_message += " duplicates"
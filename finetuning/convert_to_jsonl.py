@@ -1,5 +1,6 @@
 import csv
-import json
+
+import orjson
 
 # Path to your input CSV file
 input_csv = "finetuning_dataset.csv"
@@ -8,11 +9,22 @@ output_jsonl = "hawaiian_english_training.jsonl"
 
 # Define the structure for the fine-tuning examples
 # For translation tasks, we'll use a standard format with system, user, and assistant messages
-examples = []
+num_examples = 0
 
-# Read the CSV file
-with open(input_csv, "r", encoding="utf-8") as csvfile:
-    reader = csv.DictReader(csvfile)
+# Read the CSV file and write each training example as soon as it is
+# built: streaming keeps peak memory at one row instead of the whole
+# dataset plus its JSONL copy. orjson emits UTF-8 bytes directly, so the
+# output file is opened in binary mode and no str encode happens per row.
+with (
+    open(input_csv, "r", encoding="utf-8") as csvfile,
+    open(output_jsonl, "wb") as jsonlfile,
+):
+    # Plain csv.reader with fixed column indices: no per-row dict is
+    # built and the two fields come out by position instead of name
+    reader = csv.reader(csvfile)
+    header = next(reader)
+    hawaiian_idx = header.index("L1 Hawaiian_Text")
+    english_idx = header.index("Reference_Translation")
     for row in reader:
         # Create a training example in the format expected by OpenAI
         example = {
@@ -21,16 +33,12 @@ with open(input_csv, "r", encoding="utf-8") as csvfile:
                     "role": "system",
                     "content": "You are a helpful assistant that translates Hawaiian text to English.",
                 },
-                {"role": "user", "content": row["L1 Hawaiian_Text"]},
-                {"role": "assistant", "content": row["Reference_Translation"]},
+                {"role": "user", "content": row[hawaiian_idx]},
+                {"role": "assistant", "content": row[english_idx]},
             ]
         }
-        examples.append(example)
-
-# Write the examples to a JSONL file
-with open(output_jsonl, "w", encoding="utf-8") as jsonlfile:
-    for example in examples:
-        jsonlfile.write(json.dumps(example) + "\n")
+        jsonlfile.write(orjson.dumps(example) + b"\n")
+        num_examples += 1
 
-print(f"Successfully converted {len(examples)} examples to JSONL format.")
+print(f"Successfully converted {num_examples} examples to JSONL format.")
 print(f"Output saved to {output_jsonl}")
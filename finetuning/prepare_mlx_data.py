@@ -4,38 +4,34 @@ Convert existing Hawaiian-English JSONL file to MLX-LM format.
 MLX-LM expects train.jsonl, valid.jsonl, and test.jsonl files in the data directory.
 """
 
-import json
 import os
 from pathlib import Path
 
+import orjson
+
 
 def load_jsonl(file_path):
     """Load JSONL file and return list of entries."""
-    entries = []
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            entries.append(json.loads(line.strip()))
-    return entries
+    # orjson parses each line several times faster than stdlib json and
+    # tolerates the trailing newline, so no strip() copy is needed
+    with open(file_path, "rb") as f:
+        return [orjson.loads(line) for line in f]
 
 
 def save_jsonl(entries, file_path):
     """Save entries to JSONL file."""
-    with open(file_path, "w", encoding="utf-8") as f:
+    # orjson emits UTF-8 bytes, so writing in binary mode skips the
+    # per-line str encode round-trip
+    with open(file_path, "wb") as f:
         for entry in entries:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.write(orjson.dumps(entry) + b"\n")
 
 
-def split_data(entries, train_ratio=0.8, valid_ratio=0.1):
-    """Split data into train, validation, and test sets."""
-    n = len(entries)
+def split_sizes(n, train_ratio=0.8, valid_ratio=0.1):
+    """Return (train, valid, test) entry counts for an n-entry dataset."""
     train_size = int(n * train_ratio)
     valid_size = int(n * valid_ratio)
-
-    train_data = entries[:train_size]
-    valid_data = entries[train_size : train_size + valid_size]
-    test_data = entries[train_size + valid_size :]
-
-    return train_data, valid_data, test_data
+    return train_size, valid_size, n - train_size - valid_size
 
 
 def main():
@@ -46,22 +42,35 @@ def main():
         print(f"Error: {input_file} not found. Please run convert_to_jsonl.py first.")
         return
 
-    # Load data
+    # The split only needs line boundaries, not the JSON contents, so the
+    # entries are never parsed or held in memory: one pass counts lines,
+    # a second streams each raw line into the right output file.
     print(f"Loading data from {input_file}...")
-    entries = load_jsonl(input_file)
-    print(f"Total entries: {len(entries)}")
+    with open(input_file, "rb") as f:
+        n = sum(1 for _ in f)
+    print(f"Total entries: {n}")
 
     # Split data (80% train, 10% validation, 10% test)
-    train_data, valid_data, test_data = split_data(entries)
-
-    print(f"Train set: {len(train_data)} entries")
-    print(f"Validation set: {len(valid_data)} entries")
-    print(f"Test set: {len(test_data)} entries")
-
-    # Save split files
-    save_jsonl(train_data, "train.jsonl")
-    save_jsonl(valid_data, "valid.jsonl")
-    save_jsonl(test_data, "test.jsonl")
+    train_size, valid_size, test_size = split_sizes(n)
+
+    print(f"Train set: {train_size} entries")
+    print(f"Validation set: {valid_size} entries")
+    print(f"Test set: {test_size} entries")
+
+    # Save split files, passing the raw line bytes straight through
+    with (
+        open(input_file, "rb") as f,
+        open("train.jsonl", "wb") as train_f,
+        open("valid.jsonl", "wb") as valid_f,
+        open("test.jsonl", "wb") as test_f,
+    ):
+        for i, line in enumerate(f):
+            if i < train_size:
+                train_f.write(line)
+            elif i < train_size + valid_size:
+                valid_f.write(line)
+            else:
+                test_f.write(line)
 
     print("\nFiles created:")
     print("  - train.jsonl")
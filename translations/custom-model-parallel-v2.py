@@ -12,7 +12,24 @@ import pandas as pd
 import json
 import os
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import argparse
+
+# Optional HTTP/2 backend: with httpx (plus its h2 extra) installed, all
+# worker threads multiplex their LLM calls over a few keep-alive
+# connections instead of one TCP+TLS stream each. Without it, the pooled
+# requests.Session below is used.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+if httpx is not None:
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+    _REQUEST_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    _REQUEST_ERRORS = (requests.exceptions.RequestException,)
 import re
 import time
 import concurrent.futures
@@ -51,6 +68,73 @@ class TaskProcessor:
         self.debug = debug
         self.validate_environment()
         self.setup_output_directory()
+        self.session = self._build_session()
+        self.client = self._build_http2_client()
+
+    def _build_session(self) -> requests.Session:
+        """
+        Build the shared HTTP session used by every call_llm invocation.
+
+        A fresh requests.post pays TCP+TLS setup per request; the session
+        pools keep-alive connections to BASE_URL across the thread pool and
+        retries transient gateway/rate-limit statuses with backoff. POST is
+        opted into the retry list: a failed call returns no content, so
+        repeating it is safe here.
+        """
+        session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=MAX_PARALLEL,
+            pool_maxsize=MAX_PARALLEL,
+            max_retries=retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Set once so the headers aren't rebuilt and re-serialized per call
+        session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {API_KEY}",
+            }
+        )
+        return session
+
+    def _build_http2_client(self):
+        """
+        Build the optional httpx HTTP/2 client, or return None when httpx
+        (or its h2 extra) is unavailable.
+
+        The connection cap stays at MAX_PARALLEL rather than 1: against an
+        HTTP/2 endpoint httpx multiplexes streams over however few
+        connections it needs, while an HTTP/1.1-only endpoint still gets
+        one connection per worker instead of a serializing bottleneck.
+        """
+        if httpx is None:
+            return None
+        try:
+            # No client-level timeout: call_llm passes its per-task
+            # timeout with each request instead
+            client = httpx.Client(
+                http2=True,
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {API_KEY}",
+                },
+                limits=httpx.Limits(
+                    max_connections=MAX_PARALLEL,
+                    max_keepalive_connections=MAX_PARALLEL,
+                ),
+            )
+        except ImportError:
+            # httpx installed without the h2 extra
+            return None
+        print("Using httpx HTTP/2 client for LLM requests")
+        return client
 
     def validate_environment(self):
         """Validate required environment variables."""
@@ -74,11 +158,6 @@ class TaskProcessor:
 
     def call_llm(self, prompt: str, system_prompt: str = None) -> Optional[str]:
         """Call the LLM API with the given prompt."""
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {API_KEY}",
-        }
-
         # Use provided system prompt or fall back to config
         system_msg = (
             system_prompt if system_prompt is not None else self.config.system_prompt
@@ -104,74 +183,98 @@ class TaskProcessor:
 
         try:
             print(f"Making API request with {timeout_seconds}s timeout...")
-            response = requests.post(
-                url, headers=headers, json=payload, timeout=timeout_seconds
-            )
+            if self.client is not None:
+                # client.stream hands the response back at the headers,
+                # so the body below is consumed as it arrives — a plain
+                # client.post would buffer it whole first, defeating the
+                # streaming that keeps Cloudflare from timing out
+                with self.client.stream(
+                    "POST", url, json=payload, timeout=timeout_seconds
+                ) as response:
+                    if response.status_code != 200 or not USE_STREAMING:
+                        # Error bodies and non-streaming JSON are small;
+                        # pull them in before leaving the stream context
+                        response.read()
+                    llm_content = self._read_llm_response(response)
+            else:
+                response = self.session.post(
+                    url, json=payload, timeout=timeout_seconds
+                )
+                llm_content = self._read_llm_response(response)
 
-            if response.status_code == 200:
-                if USE_STREAMING:
-                    # Handle streaming response
-                    llm_content = ""
-                    print("Receiving streaming response...")
-                    for line in response.iter_lines():
-                        if line:
-                            line_text = line.decode("utf-8")
-                            if line_text.startswith("data: "):
-                                data_text = line_text[6:]  # Remove 'data: ' prefix
-                                if data_text.strip() == "[DONE]":
-                                    break
-                                try:
-                                    chunk_data = json.loads(data_text)
-                                    if (
-                                        "choices" in chunk_data
-                                        and len(chunk_data["choices"]) > 0
-                                    ):
-                                        delta = chunk_data["choices"][0].get(
-                                            "delta", {}
-                                        )
-                                        if "content" in delta:
-                                            content_chunk = delta["content"]
-                                            llm_content += content_chunk
-                                            if self.debug:
-                                                print(content_chunk, end="", flush=True)
-                                except json.JSONDecodeError:
-                                    continue
-                    if self.debug:
-                        print()  # New line after streaming
-                    else:
-                        print("✓ Response received")
-                else:
-                    # Handle non-streaming response
-                    llm_content = response.json()["choices"][0]["message"]["content"]
-
-                # Apply self-reasoning parser if enabled
-                if SELF_REASONING_PARSER:
-                    print("Stripping <think> content...")
-                    llm_content = re.sub(
-                        r"<think>.*?</think>", "", llm_content, flags=re.DOTALL
-                    )
+            if llm_content is None:
+                return None
 
-                # Debug: Show LLM response content
-                if self.debug:
-                    print(f"\n--- LLM Response ---")
-                    print(llm_content)
-                    print(f"--- End Response ---\n")
+            # Apply self-reasoning parser if enabled
+            if SELF_REASONING_PARSER:
+                print("Stripping <think> content...")
+                llm_content = re.sub(
+                    r"<think>.*?</think>", "", llm_content, flags=re.DOTALL
+                )
 
-                return llm_content
-            else:
-                print(f"API Error: {response.status_code}")
-                print(
-                    f"Response: {response.text[:1000]}..."
-                )  # Truncate long error messages
-                return None
+            # Debug: Show LLM response content
+            if self.debug:
+                print(f"\n--- LLM Response ---")
+                print(llm_content)
+                print(f"--- End Response ---\n")
 
-        except requests.exceptions.Timeout:
+            return llm_content
+
+        except _TIMEOUT_ERRORS:
             print(f"Request timed out after {timeout_seconds} seconds")
             return None
-        except requests.exceptions.RequestException as e:
+        except _REQUEST_ERRORS as e:
             print(f"Request failed: {e}")
             return None
 
+    def _read_llm_response(self, response) -> Optional[str]:
+        """
+        Extract the completion text from a requests or httpx response,
+        consuming a streaming body line by line. Returns None on a
+        non-200 status.
+        """
+        if response.status_code != 200:
+            print(f"API Error: {response.status_code}")
+            print(
+                f"Response: {response.text[:1000]}..."
+            )  # Truncate long error messages
+            return None
+
+        if not USE_STREAMING:
+            return response.json()["choices"][0]["message"]["content"]
+
+        llm_content = ""
+        print("Receiving streaming response...")
+        for line in response.iter_lines():
+            if line:
+                # requests yields bytes, httpx yields str
+                line_text = (
+                    line.decode("utf-8") if isinstance(line, bytes) else line
+                )
+                if line_text.startswith("data: "):
+                    data_text = line_text[6:]  # Remove 'data: ' prefix
+                    if data_text.strip() == "[DONE]":
+                        break
+                    try:
+                        chunk_data = json.loads(data_text)
+                        if (
+                            "choices" in chunk_data
+                            and len(chunk_data["choices"]) > 0
+                        ):
+                            delta = chunk_data["choices"][0].get("delta", {})
+                            if "content" in delta:
+                                content_chunk = delta["content"]
+                                llm_content += content_chunk
+                                if self.debug:
+                                    print(content_chunk, end="", flush=True)
+                    except json.JSONDecodeError:
+                        continue
+        if self.debug:
+            print()  # New line after streaming
+        else:
+            print("✓ Response received")
+        return llm_content
+
     def process_simple_translation(self, row: pd.Series, idx: int) -> Dict[str, Any]:
         """Process a single row for simple translation task."""
         source_text = row[self.config.source_column]
@@ -283,14 +386,19 @@ class TaskProcessor:
             return
 
         # Process based on task type
-        if self.config.task_type == "translation":
-            self._process_simple_dataset(df)
-        elif self.config.task_type == "analysis":
-            self._process_complex_dataset(df)
-        elif self.config.task_type == "hybrid_analysis":
-            self._process_hybrid_dataset(df)
-        else:
-            raise ValueError(f"Unknown task type: {self.config.task_type}")
+        try:
+            if self.config.task_type == "translation":
+                self._process_simple_dataset(df)
+            elif self.config.task_type == "analysis":
+                self._process_complex_dataset(df)
+            elif self.config.task_type == "hybrid_analysis":
+                self._process_hybrid_dataset(df)
+            else:
+                raise ValueError(f"Unknown task type: {self.config.task_type}")
+        finally:
+            self.session.close()
+            if self.client is not None:
+                self.client.close()
 
     def _process_simple_dataset(self, df: pd.DataFrame):
         """Process dataset for simple translation tasks."""